@@ -30,46 +30,71 @@ class Accountant:
         self.budget = config.budget
         if db_path is None:
             db_path = config.project_dir / "data" / "spending.json"
+        self.db_path = Path(db_path)
         self.db, self._db_lock = get_db(db_path)
         self.table = self.db.table("spending")
+        self._ledger_stamp: tuple[int, int] | None = None  # (mtime_ns, size) last read at
 
     def _today(self) -> str:
         """Today's date string in UTC."""
         return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    def today_spent(self) -> float:
-        """Sum of today's costs."""
+    def _today_records(self) -> list[dict]:
+        """Today's ledger rows.
+
+        TinyDB answers a repeated query from its in-memory cache, which is
+        what makes back-to-back pre_check/daily_report calls cheap, but it
+        only invalidates that cache on this process's own writes. The CLI,
+        bot and scheduler share one ledger file, so the cache is dropped
+        whenever the file's mtime or size moves.
+        """
         Record = Query()
         with self._db_lock:
-            records = self.table.search(Record.date == self._today())
-        return sum(r.get("cost", 0.0) for r in records)
+            try:
+                st = self.db_path.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamp = None
+            if stamp is None or stamp != self._ledger_stamp:
+                self.table.clear_cache()
+                self._ledger_stamp = stamp
+            return self.table.search(Record.date == self._today())
+
+    def today_spent(self) -> float:
+        """Sum of today's costs."""
+        return sum(r.get("cost", 0.0) for r in self._today_records())
 
-    def _usage_ratio(self) -> float:
-        """Fraction of daily budget used today."""
+    def _usage_ratio(self, spent: float | None = None) -> float:
+        """Fraction of daily budget used today (spent defaults to today_spent())."""
         if self.budget.daily_limit <= 0:
             return 1.0
-        return self.today_spent() / self.budget.daily_limit
+        if spent is None:
+            spent = self.today_spent()
+        return spent / self.budget.daily_limit
 
-    def pre_check(self) -> BudgetStatus:
-        """Check budget status before an API call. Raises BudgetExceeded if FROZEN."""
-        ratio = self._usage_ratio()
+    def _status_for(self, ratio: float) -> BudgetStatus:
+        """Map a usage ratio onto the charter's budget thresholds."""
         thresholds = self.budget.thresholds
-
         if ratio >= thresholds.get("critical", 1.0):
-            status = BudgetStatus.FROZEN
-        elif ratio >= thresholds.get("austerity", 0.95):
-            status = BudgetStatus.CRITICAL
-        elif ratio >= thresholds.get("caution", 0.80):
-            status = BudgetStatus.AUSTERITY
-        elif ratio >= thresholds.get("normal", 0.60):
-            status = BudgetStatus.CAUTION
-        else:
-            status = BudgetStatus.GREEN
+            return BudgetStatus.FROZEN
+        if ratio >= thresholds.get("austerity", 0.95):
+            return BudgetStatus.CRITICAL
+        if ratio >= thresholds.get("caution", 0.80):
+            return BudgetStatus.AUSTERITY
+        if ratio >= thresholds.get("normal", 0.60):
+            return BudgetStatus.CAUTION
+        return BudgetStatus.GREEN
+
+    def pre_check(self) -> BudgetStatus:
+        """Check budget status before an API call. Raises BudgetExceeded if FROZEN."""
+        spent = self.today_spent()
+        ratio = self._usage_ratio(spent)
+        status = self._status_for(ratio)
 
         if status == BudgetStatus.FROZEN:
-            remaining = max(0.0, self.budget.daily_limit - self.today_spent())
+            remaining = max(0.0, self.budget.daily_limit - spent)
             logger.warning("Budget frozen: spent=%.4f, limit=%.2f",
-                           self.today_spent(), self.budget.daily_limit)
+                           spent, self.budget.daily_limit)
             raise BudgetExceeded(remaining, self.budget.daily_limit)
 
         if status != BudgetStatus.GREEN:
@@ -107,32 +132,33 @@ class Accountant:
 
     def daily_report(self) -> dict:
         """Breakdown of today's spending by worker and model."""
-        Record = Query()
-        with self._db_lock:
-            records = self.table.search(Record.date == self._today())
+        records = self._today_records()
 
         by_worker: dict[str, float] = {}
         by_model: dict[str, float] = {}
+        spent = 0.0
         total_tokens_in = 0
         total_tokens_out = 0
 
+        # One pass over today's records for totals and status alike
         for r in records:
             w = r.get("worker", "system")
             m = r.get("model", "unknown")
             c = r.get("cost", 0.0)
             by_worker[w] = by_worker.get(w, 0.0) + c
             by_model[m] = by_model.get(m, 0.0) + c
+            spent += c
             total_tokens_in += r.get("tokens_in", 0)
             total_tokens_out += r.get("tokens_out", 0)
 
-        spent = self.today_spent()
+        ratio = self._usage_ratio(spent)
         return {
             "date": self._today(),
             "total_spent": spent,
             "daily_limit": self.budget.daily_limit,
             "remaining": max(0.0, self.budget.daily_limit - spent),
-            "usage_ratio": self._usage_ratio(),
-            "status": self.pre_check().value if self.can_spend() else "frozen",
+            "usage_ratio": ratio,
+            "status": self._status_for(ratio).value,
             "by_worker": by_worker,
             "by_model": by_model,
             "total_tokens_in": total_tokens_in,
@@ -1,14 +1,55 @@
-"""Paper trading broker — local TinyDB ledger with optional yfinance for prices."""
+"""Paper trading broker — local SQLite ledger with optional yfinance for prices."""
 
+import json
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
-from framework.db import get_db
+from framework.db import get_sqlite
 from framework.exceptions import BrokerError
+from framework.log import get_logger
+
+logger = get_logger(__name__)
 
 INITIAL_CASH = 10_000.00
+PRICE_TTL = 60  # seconds a fetched quote is reused
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS account (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    cash REAL NOT NULL,
+    initial REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY,
+    symbol TEXT NOT NULL UNIQUE,
+    quantity REAL NOT NULL,
+    avg_price REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    trade_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    side TEXT NOT NULL,
+    quantity REAL NOT NULL,
+    price REAL NOT NULL,
+    total REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(ts);
+CREATE INDEX IF NOT EXISTS idx_trades_symbol_ts ON trades(symbol, ts);
+CREATE TABLE IF NOT EXISTS prices (
+    symbol TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    price REAL NOT NULL
+);
+"""
+
+_TRADE_FIELDS = ("id", "timestamp", "symbol", "side", "quantity", "price", "total")
 
 
 @dataclass
@@ -23,40 +64,129 @@ class Trade:
 
 
 class Broker:
-    """Paper trading broker backed by TinyDB."""
+    """Paper trading broker backed by SQLite.
+
+    The ledger lives in ``broker.db``. A legacy TinyDB ``broker.json`` next to
+    it is imported once on first open and renamed to ``broker.json.migrated``.
+    """
 
     def __init__(self, db_path: Path):
-        self._db, self._db_lock = get_db(db_path)
-        self._trades = self._db.table("trades")
-        self._positions = self._db.table("positions")
-        self._account = self._db.table("account")
+        self.db_path = Path(db_path).with_suffix(".db")
+        self._db, self._db_lock = get_sqlite(self.db_path)
+        self._prices: dict[str, tuple[float, float]] = {}  # symbol -> (fetched_at, price)
+        self._fetch_locks: dict[str, threading.Lock] = {}  # one yfinance fetch per symbol at a time
+        with self._db_lock:
+            self._db.executescript(_SCHEMA)
+        self._migrate_json(self.db_path.with_suffix(".json"))
         self._init_account()
 
+    def _migrate_json(self, legacy_path: Path) -> None:
+        """Import account, positions and trades from a TinyDB JSON file."""
+        if not legacy_path.exists():
+            return
+        with self._db_lock, self._transaction():
+            if not legacy_path.exists():
+                return  # another process migrated it while we waited
+            try:
+                data = json.loads(legacy_path.read_text())
+                tables = {
+                    name: [r for _, r in sorted(data.get(name, {}).items(), key=lambda kv: int(kv[0]))]
+                    for name in ("account", "positions", "trades")
+                }
+            except (json.JSONDecodeError, OSError, AttributeError, ValueError):
+                logger.warning("Unreadable legacy broker ledger left in place: %s", legacy_path)
+                return
+            if tables["account"]:
+                acct = tables["account"][0]
+                self._db.execute(
+                    "INSERT OR REPLACE INTO account (id, cash, initial) VALUES (1, ?, ?)",
+                    (acct.get("cash", INITIAL_CASH), acct.get("initial", INITIAL_CASH)),
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO positions (symbol, quantity, avg_price) VALUES (?, ?, ?)",
+                [(p["symbol"], p["quantity"], p["avg_price"]) for p in tables["positions"]],
+            )
+            self._db.executemany(
+                "INSERT INTO trades (trade_id, ts, symbol, side, quantity, price, total) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(t.get("id", ""), t.get("timestamp", ""), t["symbol"], t["side"],
+                  t["quantity"], t["price"], t["total"]) for t in tables["trades"]],
+            )
+            legacy_path.rename(legacy_path.with_name(legacy_path.name + ".migrated"))
+            logger.info("Migrated %d trades from %s", len(tables["trades"]), legacy_path)
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block in a write transaction. Caller must hold lock."""
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
     def _init_account(self) -> None:
         """Initialize account with starting cash if empty."""
         with self._db_lock:
-            if not self._account.all():
-                self._account.insert({
-                    "cash": INITIAL_CASH,
-                    "initial": INITIAL_CASH,
-                })
+            self._db.execute(
+                "INSERT OR IGNORE INTO account (id, cash, initial) VALUES (1, ?, ?)",
+                (INITIAL_CASH, INITIAL_CASH),
+            )
 
     def _get_cash(self) -> float:
         """Current cash balance. Caller must hold lock."""
-        records = self._account.all()
-        return records[0]["cash"] if records else INITIAL_CASH
+        row = self._db.execute("SELECT cash FROM account WHERE id = 1").fetchone()
+        return row[0] if row else INITIAL_CASH
 
     def _set_cash(self, amount: float) -> None:
         """Set cash balance. Caller must hold lock."""
-        from tinydb import Query
-        Q = Query()
-        records = self._account.all()
-        if records:
-            self._account.update({"cash": amount}, doc_ids=[records[0].doc_id])
-        else:
-            self._account.insert({"cash": amount, "initial": INITIAL_CASH})
+        self._db.execute(
+            "INSERT INTO account (id, cash, initial) VALUES (1, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET cash = excluded.cash",
+            (amount, INITIAL_CASH),
+        )
 
     def get_price(self, symbol: str) -> float:
+        """Current price, reusing quotes younger than PRICE_TTL seconds.
+
+        Quotes are kept in memory and in the ``prices`` table, so repeated
+        CLI invocations within the TTL skip the yfinance round-trip. Threads
+        asking for the same symbol at once share a single fetch.
+        """
+        symbol = symbol.upper()
+        price = self._cached_price(symbol)
+        if price is not None:
+            return price
+
+        with self._fetch_locks.setdefault(symbol, threading.Lock()):
+            # Another thread may have fetched it while we waited
+            price = self._cached_price(symbol)
+            if price is not None:
+                return price
+            now = time.time()
+            price = self._fetch_price(symbol)
+            self._prices[symbol] = (now, price)
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO prices (symbol, fetched_at, price) VALUES (?, ?, ?)",
+                    (symbol, now, price),
+                )
+        return price
+
+    def _cached_price(self, symbol: str) -> float | None:
+        """Quote for symbol if one younger than PRICE_TTL is in memory or the table."""
+        cached = self._prices.get(symbol)
+        if cached is None:
+            with self._db_lock:
+                cached = self._db.execute(
+                    "SELECT fetched_at, price FROM prices WHERE symbol = ?", (symbol,),
+                ).fetchone()
+        if cached and time.time() - cached[0] < PRICE_TTL:
+            return cached[1]
+        return None
+
+    def _fetch_price(self, symbol: str) -> float:
         """Fetch current price via yfinance. Raises BrokerError if unavailable."""
         try:
             import yfinance as yf
@@ -91,7 +221,7 @@ class Broker:
 
         total = price * quantity
 
-        with self._db_lock:
+        with self._db_lock, self._transaction():
             if side == "buy":
                 cash = self._get_cash()
                 if total > cash:
@@ -112,80 +242,78 @@ class Broker:
                 price=price,
                 total=total,
             )
-            self._trades.insert({
-                "id": trade.id,
-                "timestamp": trade.timestamp,
-                "symbol": trade.symbol,
-                "side": trade.side,
-                "quantity": trade.quantity,
-                "price": trade.price,
-                "total": trade.total,
-            })
+            self._db.execute(
+                "INSERT INTO trades (trade_id, ts, symbol, side, quantity, price, total) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (trade.id, trade.timestamp, trade.symbol, trade.side,
+                 trade.quantity, trade.price, trade.total),
+            )
 
         return trade
 
+    def _get_position(self, symbol: str) -> tuple[float, float] | None:
+        """(quantity, avg_price) for symbol, or None. Caller must hold lock."""
+        return self._db.execute(
+            "SELECT quantity, avg_price FROM positions WHERE symbol = ?", (symbol,),
+        ).fetchone()
+
     def _update_position_buy(self, symbol: str, quantity: float, price: float) -> None:
         """Add to position. Caller must hold lock."""
-        from tinydb import Query
-        Q = Query()
-        existing = self._positions.search(Q.symbol == symbol)
+        existing = self._get_position(symbol)
         if existing:
-            pos = existing[0]
-            old_qty = pos["quantity"]
-            old_avg = pos["avg_price"]
+            old_qty, old_avg = existing
             new_qty = old_qty + quantity
             new_avg = (old_qty * old_avg + quantity * price) / new_qty
-            self._positions.update(
-                {"quantity": new_qty, "avg_price": new_avg},
-                doc_ids=[pos.doc_id],
+            self._db.execute(
+                "UPDATE positions SET quantity = ?, avg_price = ? WHERE symbol = ?",
+                (new_qty, new_avg, symbol),
             )
         else:
-            self._positions.insert({
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": price,
-            })
+            self._db.execute(
+                "INSERT INTO positions (symbol, quantity, avg_price) VALUES (?, ?, ?)",
+                (symbol, quantity, price),
+            )
 
     def _update_position_sell(self, symbol: str, quantity: float, price: float) -> None:
         """Reduce position. Caller must hold lock."""
-        from tinydb import Query
-        Q = Query()
-        existing = self._positions.search(Q.symbol == symbol)
+        existing = self._get_position(symbol)
         if not existing:
             raise BrokerError(f"No position in {symbol} to sell")
 
-        pos = existing[0]
-        if quantity > pos["quantity"]:
+        held = existing[0]
+        if quantity > held:
             raise BrokerError(
-                f"Insufficient shares: have {pos['quantity']}, trying to sell {quantity}",
+                f"Insufficient shares: have {held}, trying to sell {quantity}",
             )
 
         cash = self._get_cash()
         self._set_cash(cash + quantity * price)
 
-        new_qty = pos["quantity"] - quantity
+        new_qty = held - quantity
         if new_qty < 1e-9:  # effectively zero
-            self._positions.remove(doc_ids=[pos.doc_id])
+            self._db.execute("DELETE FROM positions WHERE symbol = ?", (symbol,))
         else:
-            self._positions.update(
-                {"quantity": new_qty},
-                doc_ids=[pos.doc_id],
+            self._db.execute(
+                "UPDATE positions SET quantity = ? WHERE symbol = ?", (new_qty, symbol),
             )
 
     def get_positions(self) -> list[dict]:
         """Return all current positions (no live price lookup)."""
         with self._db_lock:
-            return self._positions.all()
+            rows = self._db.execute(
+                "SELECT symbol, quantity, avg_price FROM positions ORDER BY id",
+            ).fetchall()
+        return [{"symbol": sym, "quantity": qty, "avg_price": avg} for sym, qty, avg in rows]
 
     def get_account(self) -> dict:
         """Return account summary: cash, positions value, equity, P&L."""
         with self._db_lock:
-            cash = self._get_cash()
-            positions = self._positions.all()
-            records = self._account.all()
-            initial = records[0].get("initial", INITIAL_CASH) if records else INITIAL_CASH
+            row = self._db.execute("SELECT cash, initial FROM account WHERE id = 1").fetchone()
+            positions_value = self._db.execute(
+                "SELECT COALESCE(SUM(quantity * avg_price), 0.0) FROM positions",
+            ).fetchone()[0]
+        cash, initial = row if row else (INITIAL_CASH, INITIAL_CASH)
 
-        positions_value = sum(p["quantity"] * p["avg_price"] for p in positions)
         equity = cash + positions_value
         return {
             "cash": cash,
@@ -197,13 +325,14 @@ class Broker:
 
     def get_trades(self, symbol: str | None = None, limit: int = 50) -> list[dict]:
         """Trade history, newest first. Optionally filtered by symbol."""
-        with self._db_lock:
-            if symbol:
-                from tinydb import Query
-                Q = Query()
-                trades = self._trades.search(Q.symbol == symbol.upper())
-            else:
-                trades = self._trades.all()
+        sql = "SELECT trade_id, ts, symbol, side, quantity, price, total FROM trades"
+        params: list = []
+        if symbol:
+            sql += " WHERE symbol = ?"
+            params.append(symbol.upper())
+        sql += " ORDER BY ts DESC, id ASC LIMIT ?"
+        params.append(limit)
 
-        trades.sort(key=lambda t: t.get("timestamp", ""), reverse=True)
-        return trades[:limit]
+        with self._db_lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [dict(zip(_TRADE_FIELDS, row)) for row in rows]
@@ -1,13 +1,14 @@
 """Project configuration loader — reads charter.yaml + .env."""
 
 import warnings
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 import yaml
 from dotenv import load_dotenv
 
 from framework.exceptions import ConfigError
+from framework.validation import safe_load_yaml
 
 
 @dataclass
@@ -96,6 +97,24 @@ class GitConfig:
     branch: str = "main"
 
 
+def load_env(project_dir: Path) -> None:
+    """Load project_dir/.env if present, warning if it is group/other readable."""
+    env_file = Path(project_dir) / ".env"
+    if not env_file.exists():
+        return
+    load_dotenv(env_file)
+    try:
+        mode = env_file.stat().st_mode
+        if mode & 0o077:
+            warnings.warn(
+                f".env file at {env_file} is group/other readable (mode {oct(mode)}). "
+                "Run: chmod 600 .env",
+                stacklevel=2,
+            )
+    except OSError:
+        pass
+
+
 @dataclass
 class ProjectConfig:
     name: str
@@ -114,26 +133,39 @@ class ProjectConfig:
     marketplace_url: str = ""
     board_enabled: bool = False
 
+    def to_dict(self) -> dict:
+        """Plain-data form of the parsed config (no project_dir), for caching."""
+        data = asdict(self)
+        del data["project_dir"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict, project_dir: Path) -> "ProjectConfig":
+        """Rebuild a config from to_dict() output. Raises KeyError/TypeError if malformed."""
+        return cls(
+            name=data["name"],
+            owner=data["owner"],
+            mission=data["mission"],
+            project_dir=Path(project_dir),
+            budget=BudgetConfig(**data["budget"]),
+            model_tiers={k: ModelTier(**v) for k, v in data["model_tiers"].items()},
+            git=GitConfig(**data["git"]),
+            worker_defaults=WorkerDefaults(**data["worker_defaults"]),
+            promotion_rules=PromotionRules(**data["promotion_rules"]),
+            logging=LoggingConfig(**data["logging"]),
+            retention=RetentionConfig(**data["retention"]),
+            security=SecurityConfig(**data["security"]),
+            tools=ToolsConfig(**data["tools"]),
+            marketplace_url=data["marketplace_url"],
+            board_enabled=data["board_enabled"],
+        )
+
     @staticmethod
     def load(project_dir: Path) -> "ProjectConfig":
         """Load project configuration from charter.yaml and .env in project_dir."""
         project_dir = Path(project_dir)
 
-        # Load .env if present
-        env_file = project_dir / ".env"
-        if env_file.exists():
-            load_dotenv(env_file)
-            # Warn if .env is group/other readable
-            try:
-                mode = env_file.stat().st_mode
-                if mode & 0o077:
-                    warnings.warn(
-                        f".env file at {env_file} is group/other readable (mode {oct(mode)}). "
-                        "Run: chmod 600 .env",
-                        stacklevel=2,
-                    )
-            except OSError:
-                pass
+        load_env(project_dir)
 
         # Load charter.yaml
         charter_path = project_dir / "charter.yaml"
@@ -144,7 +176,7 @@ class ProjectConfig:
             )
 
         try:
-            raw = yaml.safe_load(charter_path.read_text())
+            raw = safe_load_yaml(charter_path.read_text())
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in charter.yaml: {e}")
 
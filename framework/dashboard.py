@@ -15,7 +15,7 @@ from framework.router import Router
 from framework.scheduler import Scheduler
 from framework.validation import RateLimiter, validate_worker_name
 from framework.exceptions import ValidationError
-from framework.worker import Worker
+from framework.worker import LEVEL_TITLES, Worker, level_title
 from framework.workflow import WorkflowEngine
 
 logger = get_logger(__name__)
@@ -38,7 +38,7 @@ def create_dashboard_app(config: ProjectConfig, accountant: Accountant,
 
     token = auth_token if auth_token is not None else os.getenv("DASHBOARD_TOKEN", "")
 
-    event_log = EventLog(config.project_dir / "data" / "events.json")
+    event_log = EventLog(config.project_dir / "data" / "events.db")
     scheduler = Scheduler(config, accountant, router, event_log)
     engine = WorkflowEngine(config, accountant, router, event_log)
 
@@ -47,8 +47,6 @@ def create_dashboard_app(config: ProjectConfig, accountant: Accountant,
         burst=config.security.dashboard_rate_burst,
     )
 
-    seniority = {1: "Intern", 2: "Junior", 3: "Mid", 4: "Senior", 5: "Principal"}
-
     @app.before_request
     def check_auth_and_rate():
         # Rate limiting
@@ -97,7 +95,7 @@ def create_dashboard_app(config: ProjectConfig, accountant: Accountant,
     def workers_page():
         review = hr.team_review()
         return render_template("workers.html",
-                               config=config, workers=review, seniority=seniority)
+                               config=config, workers=review, seniority=LEVEL_TITLES)
 
     @app.route("/workers/<name>")
     def worker_detail(name):
@@ -110,7 +108,7 @@ def create_dashboard_app(config: ProjectConfig, accountant: Accountant,
             return render_template("error.html", message=f"Worker '{name}' not found"), 404
         worker = Worker(name, config.project_dir, config)
         summary = worker.performance_summary()
-        title = seniority.get(worker.level, f"L{worker.level}")
+        title = level_title(worker.level)
         return render_template("worker_detail.html",
                                config=config, worker=worker, summary=summary,
                                title=title)
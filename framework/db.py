@@ -1,11 +1,13 @@
-"""Thread-safe TinyDB wrapper — singleton per file path."""
+"""Thread-safe TinyDB and SQLite wrappers — singleton per file path."""
 
+import sqlite3
 import threading
 from pathlib import Path
 
 from tinydb import TinyDB
 
 _registry: dict[str, tuple[TinyDB, threading.Lock]] = {}
+_sqlite_registry: dict[str, tuple[sqlite3.Connection, threading.Lock]] = {}
 _registry_lock = threading.Lock()
 
 
@@ -19,15 +21,36 @@ def get_db(db_path: Path) -> tuple[TinyDB, threading.Lock]:
         return _registry[path_str]
 
 
+def get_sqlite(db_path: Path) -> tuple[sqlite3.Connection, threading.Lock]:
+    """Get or create a (Connection, Lock) pair. One connection per resolved path.
+
+    The connection is in autocommit mode with WAL journaling, so a daemon
+    appending rows doesn't block CLI readers in other processes.
+    """
+    path_str = str(Path(db_path).resolve())
+    with _registry_lock:
+        if path_str not in _sqlite_registry:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path_str, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            _sqlite_registry[path_str] = (conn, threading.Lock())
+        return _sqlite_registry[path_str]
+
+
 def close_all() -> None:
-    """Close all TinyDB instances and clear registry."""
+    """Close all TinyDB instances and SQLite connections and clear registries."""
     with _registry_lock:
         for db, _ in _registry.values():
             db.close()
         _registry.clear()
+        for conn, _ in _sqlite_registry.values():
+            conn.close()
+        _sqlite_registry.clear()
 
 
 def _reset_registry() -> None:
     """For testing only — clear without closing."""
     with _registry_lock:
         _registry.clear()
+        _sqlite_registry.clear()
@@ -1,17 +1,33 @@
-"""Event system — TinyDB-backed log with in-memory pub/sub."""
+"""Event system — SQLite-backed log with in-memory pub/sub."""
 
+import json
+import sqlite3
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
-from tinydb import Query
-
-from framework.db import get_db
+from framework.db import get_sqlite
 from framework.log import get_logger
+from framework.validation import dump_json, parse_json
 
 logger = get_logger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    type TEXT NOT NULL,
+    source TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events(type, ts);
+"""
+
+_FETCH_BATCH = 100  # rows pulled per lock acquisition in iter_query
+
 
 @dataclass
 class Event:
@@ -22,26 +38,75 @@ class Event:
 
 
 class EventLog:
-    """Persistent event log with pub/sub dispatch."""
+    """Persistent event log with pub/sub dispatch.
+
+    Events live in ``events.db`` (SQLite). A legacy TinyDB ``events.json``
+    next to it is imported once on first open and renamed to
+    ``events.json.migrated``.
+    """
 
     def __init__(self, db_path: Path):
-        self.db_path = Path(db_path)
-        self._db, self._db_lock = get_db(self.db_path)
+        self.db_path = Path(db_path).with_suffix(".db")
+        self._db = None  # opened on first use; many commands never touch events
+        self._db_lock = None
+        self._open_lock = threading.Lock()
         self._handlers: dict[str, list[Callable]] = {}
 
+    def _connect(self) -> tuple[sqlite3.Connection, threading.Lock]:
+        """Open the shared connection, creating the schema and importing legacy JSON."""
+        if self._db is None:
+            with self._open_lock:
+                if self._db is None:
+                    db, lock = get_sqlite(self.db_path)
+                    with lock:
+                        db.executescript(_SCHEMA)
+                    self._migrate_json(db, lock, self.db_path.with_suffix(".json"))
+                    self._db_lock = lock
+                    self._db = db
+        return self._db, self._db_lock
+
+    @staticmethod
+    def _migrate_json(db: sqlite3.Connection, lock: threading.Lock, legacy_path: Path) -> None:
+        """Import events from a TinyDB JSON file, then move it aside."""
+        if not legacy_path.exists():
+            return
+        with lock:
+            # IMMEDIATE serialises concurrent openers so only one imports the file
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                if legacy_path.exists():
+                    try:
+                        table = json.loads(legacy_path.read_text()).get("_default", {})
+                    except (json.JSONDecodeError, OSError, AttributeError):
+                        logger.warning("Unreadable legacy event log left in place: %s", legacy_path)
+                        table = None
+                    if table is not None:
+                        rows = [
+                            (r.get("timestamp", ""), r.get("type", ""), r.get("source", ""),
+                             json.dumps(r.get("data", {})))
+                            for _, r in sorted(table.items(), key=lambda kv: int(kv[0]))
+                        ]
+                        db.executemany(
+                            "INSERT INTO events (ts, type, source, data) VALUES (?, ?, ?, ?)", rows,
+                        )
+                        legacy_path.rename(legacy_path.with_name(legacy_path.name + ".migrated"))
+                        logger.info("Migrated %d events from %s", len(rows), legacy_path)
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
     def emit(self, event: Event) -> None:
         """Persist an event and dispatch to registered handlers."""
         if not event.timestamp:
             event.timestamp = datetime.now(timezone.utc).isoformat()
 
-        record = {
-            "type": event.type,
-            "source": event.source,
-            "data": event.data,
-            "timestamp": event.timestamp,
-        }
-        with self._db_lock:
-            self._db.insert(record)
+        db, lock = self._connect()
+        with lock:
+            db.execute(
+                "INSERT INTO events (ts, type, source, data) VALUES (?, ?, ?, ?)",
+                (event.timestamp, event.type, event.source, dump_json(event.data)),
+            )
 
         # Dispatch to type-specific handlers
         for handler in self._handlers.get(event.type, []):
@@ -69,30 +134,51 @@ class EventLog:
         if handler in handlers:
             handlers.remove(handler)
 
-    def query(self, event_type: str | None = None, source: str | None = None,
-              limit: int = 50) -> list[dict]:
-        """Query events, newest first. Supports type and source filters."""
-        Q = Query()
+    def iter_query(self, event_type: str | None = None, source: str | None = None,
+                   limit: int = 50) -> Iterator[dict]:
+        """Yield events newest first, reading rows in batches rather than all at once."""
+        sql = "SELECT ts, type, source, data FROM events"
         conditions = []
+        params: list = []
         if event_type:
-            conditions.append(Q.type == event_type)
+            conditions.append("type = ?")
+            params.append(event_type)
         if source:
-            conditions.append(Q.source == source)
+            conditions.append("source = ?")
+            params.append(source)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        # id breaks timestamp ties in insertion order
+        sql += " ORDER BY ts DESC, id ASC LIMIT ?"
+        params.append(limit)
+
+        db, lock = self._connect()
+        with lock:
+            cursor = db.execute(sql, params)
+        try:
+            while True:
+                with lock:
+                    rows = cursor.fetchmany(_FETCH_BATCH)
+                if not rows:
+                    return
+                for ts, type_, source_, data in rows:
+                    yield {"type": type_, "source": source_, "data": parse_json(data), "timestamp": ts}
+        finally:
+            cursor.close()
 
-        with self._db_lock:
-            if conditions:
-                combined = conditions[0]
-                for c in conditions[1:]:
-                    combined = combined & c
-                results = self._db.search(combined)
-            else:
-                results = self._db.all()
+    def query(self, event_type: str | None = None, source: str | None = None,
+              limit: int = 50) -> list[dict]:
+        """Query events, newest first. Supports type and source filters."""
+        return list(self.iter_query(event_type=event_type, source=source, limit=limit))
 
-        # Sort newest first by timestamp
-        results.sort(key=lambda r: r.get("timestamp", ""), reverse=True)
-        return results[:limit]
+    def remove_before(self, cutoff: str) -> int:
+        """Delete events with a timestamp older than cutoff. Returns count removed."""
+        db, lock = self._connect()
+        with lock:
+            return db.execute("DELETE FROM events WHERE ts < ?", (cutoff,)).rowcount
 
     def clear(self) -> None:
         """Remove all events (for testing)."""
-        with self._db_lock:
-            self._db.truncate()
+        db, lock = self._connect()
+        with lock:
+            db.execute("DELETE FROM events")
@@ -8,7 +8,9 @@ from tinydb import Query
 
 from framework.config import RetentionConfig
 from framework.db import get_db
+from framework.events import EventLog
 from framework.log import get_logger
+from framework.validation import safe_write_json
 
 logger = get_logger(__name__)
 
@@ -35,16 +37,12 @@ class Housekeeper:
 
     def clean_events(self) -> int:
         """Remove events older than retention.events_days."""
-        db_path = self.data_dir / "events.json"
-        if not db_path.exists():
+        db_path = self.data_dir / "events.db"
+        if not db_path.exists() and not db_path.with_suffix(".json").exists():
             return 0
 
         cutoff = (datetime.now(timezone.utc) - timedelta(days=self.retention.events_days)).isoformat()
-        db, lock = get_db(db_path)
-        Q = Query()
-        with lock:
-            removed = db.remove(Q.timestamp.test(lambda ts: ts < cutoff))
-        return len(removed)
+        return EventLog(db_path).remove_before(cutoff)
 
     def clean_spending(self) -> int:
         """Remove spending records older than retention.spending_days."""
@@ -97,7 +95,7 @@ class Housekeeper:
             excess = len(records) - self.retention.performance_max
             # Keep newest entries (end of list)
             trimmed = records[excess:]
-            perf_path.write_text(json.dumps(trimmed, indent=2))
+            safe_write_json(perf_path, trimmed)
             total_removed += excess
 
         return total_removed
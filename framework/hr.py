@@ -1,6 +1,8 @@
 """HR — hiring, firing, and managing workers."""
 
+import heapq
 import json
+import os
 import shutil
 from pathlib import Path
 
@@ -10,7 +12,7 @@ from framework.config import ProjectConfig, PromotionRules
 from framework.exceptions import TrainingError, WorkerNotFound
 from framework.knowledge import KnowledgeBase, KnowledgeEntry, chunk_text, validate_knowledge
 from framework.log import get_logger
-from framework.validation import validate_worker_name
+from framework.validation import safe_dump_yaml, safe_load_yaml, validate_worker_name
 from framework.worker import Worker
 
 logger = get_logger(__name__)
@@ -25,6 +27,8 @@ class HR:
         self.workers_dir = project_dir / "workers"
         self.templates_dir = project_dir / "templates"
         self.workers_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed worker YAML keyed by path, with the (mtime_ns, size) it was read at
+        self._yaml_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
 
     def hire_from_template(self, template_name: str, worker_name: str) -> Worker:
         """Copy a template directory to workers/ and return the new Worker."""
@@ -68,7 +72,7 @@ class HR:
 
         # skills.yaml
         skills = {"role": role, "skills": [role]}
-        (worker_dir / "skills.yaml").write_text(yaml.dump(skills, default_flow_style=False))
+        (worker_dir / "skills.yaml").write_text(safe_dump_yaml(skills))
 
         # config.yaml
         config = {
@@ -76,7 +80,7 @@ class HR:
             "max_context_tokens": self.config.worker_defaults.max_context_tokens,
             "model": self.config.worker_defaults.model,
         }
-        (worker_dir / "config.yaml").write_text(yaml.dump(config, default_flow_style=False))
+        (worker_dir / "config.yaml").write_text(safe_dump_yaml(config))
 
         # memory.json + performance.json
         (worker_dir / "memory.json").write_text("[]")
@@ -84,38 +88,52 @@ class HR:
 
         return Worker(worker_name, self.project_dir, self.config)
 
+    def _load_yaml_cached(self, path: Path) -> dict | None:
+        """Parsed YAML at path, re-read only when it changes. None if the file is missing.
+
+        Long-lived callers (the bot, the dashboard) list workers repeatedly;
+        this keeps them from re-parsing every config.yaml and skills.yaml.
+        Callers must not mutate the returned dict.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            self._yaml_cache.pop(path, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._yaml_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            data = safe_load_yaml(path.read_text()) or {}
+        except (yaml.YAMLError, OSError):
+            data = {}
+        self._yaml_cache[path] = (stamp, data)
+        return data
+
     def list_workers(self) -> list[dict]:
         """List all workers with their config summary."""
         workers = []
         if not self.workers_dir.exists():
+            self._yaml_cache.clear()
             return workers
 
-        for d in sorted(self.workers_dir.iterdir()):
-            if not d.is_dir() or d.name.startswith("."):
-                continue
+        with os.scandir(self.workers_dir) as it:
+            names = sorted(e.name for e in it if e.is_dir() and not e.name.startswith("."))
 
-            config_path = d / "config.yaml"
-            level = 1
-            if config_path.exists():
-                try:
-                    cfg = yaml.safe_load(config_path.read_text()) or {}
-                    level = cfg.get("level", 1)
-                except yaml.YAMLError:
-                    pass
-
-            skills_path = d / "skills.yaml"
-            role = "unknown"
-            if skills_path.exists():
-                try:
-                    sk = yaml.safe_load(skills_path.read_text()) or {}
-                    role = sk.get("role", "unknown")
-                except yaml.YAMLError:
-                    pass
+        # Drop entries for fired/removed workers so a long-lived HR doesn't hoard them
+        current = set(names)
+        for path in [p for p in self._yaml_cache if p.parent.name not in current]:
+            del self._yaml_cache[path]
 
+        for name in names:
+            d = self.workers_dir / name
+            cfg = self._load_yaml_cached(d / "config.yaml")
+            sk = self._load_yaml_cached(d / "skills.yaml")
             workers.append({
-                "name": d.name,
-                "level": level,
-                "role": role,
+                "name": name,
+                "level": cfg.get("level", 1) if cfg is not None else 1,
+                "role": sk.get("role", "unknown") if sk is not None else "unknown",
             })
 
         return workers
@@ -157,7 +175,7 @@ class HR:
         if workflows_dir.exists():
             for wf_file in sorted(workflows_dir.glob("*.yaml")):
                 try:
-                    raw = yaml.safe_load(wf_file.read_text())
+                    raw = safe_load_yaml(wf_file.read_text())
                     if not isinstance(raw, dict):
                         continue
                     for node_id, node_data in (raw.get("nodes") or {}).items():
@@ -185,16 +203,19 @@ class HR:
         config_path = worker_dir / "config.yaml"
         config: dict = {}
         if config_path.exists():
-            config = yaml.safe_load(config_path.read_text()) or {}
+            config = safe_load_yaml(config_path.read_text()) or {}
 
         current = config.get("level", 1)
         new_level = max(current - 1, 1)
         config["level"] = new_level
-        config_path.write_text(yaml.dump(config, default_flow_style=False))
+        config_path.write_text(safe_dump_yaml(config))
         return new_level
 
-    def team_review(self) -> list[dict]:
-        """Aggregate all workers' performance, sorted by avg_rating desc."""
+    def team_review(self, limit: int | None = None) -> list[dict]:
+        """Aggregate all workers' performance, sorted by avg_rating desc.
+
+        With limit, only the top `limit` workers are returned.
+        """
         results = []
         for info in self.list_workers():
             try:
@@ -208,6 +229,8 @@ class HR:
                 })
             except Exception:
                 continue
+        if limit is not None:
+            return heapq.nlargest(limit, results, key=lambda r: r.get("avg_rating", 0))
         results.sort(key=lambda r: r.get("avg_rating", 0), reverse=True)
         return results
 
@@ -264,12 +287,12 @@ class HR:
         config_path = worker_dir / "config.yaml"
         config: dict = {}
         if config_path.exists():
-            config = yaml.safe_load(config_path.read_text()) or {}
+            config = safe_load_yaml(config_path.read_text()) or {}
 
         current = config.get("level", 1)
         new_level = min(current + 1, 5)
         config["level"] = new_level
-        config_path.write_text(yaml.dump(config, default_flow_style=False))
+        config_path.write_text(safe_dump_yaml(config))
         return new_level
 
     def train_from_youtube(self, worker_name: str, url: str) -> str:
@@ -1,9 +1,12 @@
 """Knowledge base — chunking, search, and validation for worker training."""
 
+import functools
 import json
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
+from framework.validation import dump_json, parse_json
+
 
 @dataclass
 class KnowledgeEntry:
@@ -15,6 +18,11 @@ class KnowledgeEntry:
     title: str = ""      # Optional filename/page title
     chunk_index: int = 0 # Which chunk of the source (0 = first/only)
 
+    @functools.cached_property
+    def content_lower(self) -> str:
+        """Lowercased content, built once; a worker's KB is searched every chat turn."""
+        return self.content.lower()
+
 
 def chunk_text(text: str, chunk_size: int = 2000, overlap: int = 200) -> list[str]:
     """Split text into chunks on paragraph boundaries.
@@ -118,7 +126,7 @@ def search_knowledge(
     # Score each entry by keyword occurrence count
     scored: list[tuple[int, int, KnowledgeEntry]] = []
     for i, entry in enumerate(entries):
-        content_lower = entry.content.lower()
+        content_lower = entry.content_lower
         score = sum(content_lower.count(kw) for kw in keywords)
         scored.append((score, i, entry))
 
@@ -216,7 +224,7 @@ class KnowledgeBase:
             return cls(knowledge_dir, [])
 
         try:
-            data = json.loads(knowledge_path.read_text())
+            data = parse_json(knowledge_path.read_bytes())
             entries = [
                 KnowledgeEntry(
                     source=d.get("source", ""),
@@ -235,10 +243,9 @@ class KnowledgeBase:
         """Write entries to knowledge.json."""
         self.knowledge_dir.mkdir(parents=True, exist_ok=True)
         knowledge_path = self.knowledge_dir / "knowledge.json"
-        knowledge_path.write_text(json.dumps(
-            [asdict(e) for e in self.entries],
-            indent=2,
-        ))
+        knowledge_path.write_text(
+            dump_json([asdict(e) for e in self.entries], indent=True), encoding="utf-8",
+        )
 
     def add_entries(self, new_entries: list[KnowledgeEntry]) -> None:
         """Append new entries and save."""
@@ -7,6 +7,7 @@ import httpx
 import yaml
 
 from framework.exceptions import MarketplaceError
+from framework.validation import safe_load_yaml
 
 
 class Marketplace:
@@ -34,7 +35,7 @@ class Marketplace:
                                    suggestion="Check your network connection and registry URL.")
 
         try:
-            data = yaml.safe_load(response.text)
+            data = safe_load_yaml(response.text)
         except yaml.YAMLError as e:
             raise MarketplaceError(f"Invalid registry YAML: {e}")
 
@@ -19,6 +19,7 @@ import yaml
 from framework.config import ToolsConfig, _DEFAULT_BLOCKED_HOSTS
 from framework.exceptions import PluginError, ToolError
 from framework.log import get_logger
+from framework.validation import safe_load_yaml
 
 logger = get_logger(__name__)
 
@@ -802,7 +803,7 @@ def load_custom_plugins(plugins_dir: Path, registry: ToolRegistry) -> list[str]:
             continue
 
         try:
-            manifest = yaml.safe_load(manifest_path.read_text())
+            manifest = safe_load_yaml(manifest_path.read_text())
         except yaml.YAMLError as e:
             logger.warning("Plugin '%s': invalid YAML: %s", plugin_dir.name, e)
             continue
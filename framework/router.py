@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Generator
@@ -44,6 +45,8 @@ class Router:
         self.retry_base_delay = retry_base_delay
         self.retry_max_delay = retry_max_delay
         self._pricing_cache: dict[str, dict] | None = None
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()  # callers may be asyncio.to_thread workers
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -53,6 +56,24 @@ class Router:
             "X-Title": "open-corp",
         }
 
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled HTTP client, created on first call and reused so repeat calls skip the TLS handshake."""
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=60.0)
+                client = self._client
+        return client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def _get_models_for_tier(self, tier: str) -> list[str]:
         """Get model list for a tier from config."""
         tier_config = self.config.model_tiers.get(tier)
@@ -231,7 +252,7 @@ class Router:
         if tools is not None:
             payload["tools"] = tools
 
-        resp = httpx.post(
+        resp = self.client.post(
             OPENROUTER_API_URL,
             headers=self._headers(),
             json=payload,
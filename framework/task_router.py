@@ -1,5 +1,7 @@
 """TaskRouter — select the best worker for a given task description."""
 
+from typing import Callable
+
 from framework.config import ProjectConfig
 from framework.hr import HR
 from framework.worker import Worker
@@ -8,9 +10,13 @@ from framework.worker import Worker
 class TaskRouter:
     """Routes tasks to workers based on skill match, performance, and seniority."""
 
-    def __init__(self, config: ProjectConfig, hr: HR):
+    def __init__(self, config: ProjectConfig, hr: HR,
+                 load_worker: Callable[[str], Worker] | None = None):
         self.config = config
         self.hr = hr
+        # Long-running callers (the bot) pass a caching loader so scoring
+        # doesn't re-read every worker's files on each call
+        self.load_worker = load_worker or (lambda name: Worker(name, hr.project_dir, config))
 
     def select_worker(self, task_description: str, workers: list[str] | None = None) -> str | None:
         """Score and select the best worker for a task.
@@ -40,7 +46,7 @@ class TaskRouter:
 
         for info in worker_list:
             try:
-                worker = Worker(info["name"], self.hr.project_dir, self.config)
+                worker = self.load_worker(info["name"])
             except Exception:
                 continue
 
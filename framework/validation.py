@@ -1,4 +1,4 @@
-"""Input validation — worker names, paths, payloads, rate limiting, safe JSON I/O."""
+"""Input validation — worker names, paths, payloads, rate limiting, safe JSON/YAML I/O."""
 
 import json
 import re
@@ -8,11 +8,24 @@ import time
 import warnings
 from pathlib import Path
 
+import yaml
+
 from framework.exceptions import ValidationError
 from framework.log import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader  # LibYAML C bindings
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+try:
+    from orjson import OPT_INDENT_2 as _ORJSON_INDENT_2, dumps as _orjson_dumps  # optional Rust codec
+    from orjson import loads as _orjson_loads  # reads bytes directly
+except ImportError:
+    _orjson_dumps = _orjson_loads = None
+
 # Worker name: alphanumeric start, then alphanumeric/underscore/hyphen, 1-64 chars
 _WORKER_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_-]{0,63}$")
 
@@ -99,6 +112,34 @@ class RateLimiter:
             return len(stale)
 
 
+def parse_json(data: bytes | str):
+    """json.loads, via orjson when it's installed.
+
+    Anything orjson refuses (NaN/Infinity, integers past 64 bits) is retried
+    with the stdlib parser, so both accept the same documents.
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+def dump_json(data, indent: bool = False) -> str:
+    """json.dumps (2-space indent if asked), via orjson when it's installed.
+
+    Values orjson won't encode (non-str keys, integers past 64 bits) fall
+    back to the stdlib encoder.
+    """
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(data, option=_ORJSON_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2 if indent else None)
+
+
 def safe_load_json(path: Path, default=None, warn: bool = True):
     """Load JSON from path with corruption detection.
 
@@ -112,10 +153,10 @@ def safe_load_json(path: Path, default=None, warn: bool = True):
         return default
 
     try:
-        text = path.read_text(encoding="utf-8")
-        if not text.strip():
+        data = path.read_bytes()
+        if not data.strip():
             return default
-        return json.loads(text)
+        return parse_json(data)
     except (json.JSONDecodeError, UnicodeDecodeError) as e:
         # Back up corrupted file
         corrupt_path = path.with_suffix(path.suffix + ".corrupt")
@@ -138,7 +179,7 @@ def safe_write_json(path: Path, data) -> None:
     Uses POSIX Path.replace for atomic rename within same filesystem.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    content = json.dumps(data, indent=2)
+    content = dump_json(data, indent=True)
 
     # Write to temp file in same directory (same filesystem for atomic rename)
     fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
@@ -150,3 +191,14 @@ def safe_write_json(path: Path, data) -> None:
     except Exception:
         tmp_path.unlink(missing_ok=True)
         raise
+
+
+def safe_load_yaml(text: str):
+    """yaml.safe_load, using the LibYAML parser when PyYAML was built with it."""
+    return yaml.load(text, Loader=_YamlLoader)
+
+
+def safe_dump_yaml(data, **kwargs) -> str:
+    """yaml.safe_dump, using the LibYAML emitter when PyYAML was built with it."""
+    kwargs.setdefault("default_flow_style", False)
+    return yaml.dump(data, Dumper=_YamlDumper, **kwargs)
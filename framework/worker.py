@@ -10,7 +10,7 @@ from framework.config import ProjectConfig
 from framework.exceptions import WorkerNotFound
 from framework.knowledge import KnowledgeBase, search_knowledge
 from framework.router import Router
-from framework.validation import safe_load_json, safe_write_json
+from framework.validation import safe_load_json, safe_load_yaml, safe_write_json
 
 # Seniority level → tier mapping
 LEVEL_TIER_MAP = {
@@ -21,6 +21,14 @@ LEVEL_TIER_MAP = {
     5: "premium", # Principal
 }
 
+# Seniority level → display title
+LEVEL_TITLES = {1: "Intern", 2: "Junior", 3: "Mid", 4: "Senior", 5: "Principal"}
+
+
+def level_title(level: int) -> str:
+    """Display title for a seniority level, e.g. 3 → 'Mid'; unknown levels → 'L<n>'."""
+    return LEVEL_TITLES.get(level, f"L{level}")
+
 
 class Worker:
     """A specialist worker with personality, memory, and skills."""
@@ -40,6 +48,7 @@ class Worker:
         self.worker_config = self._load_config()
         self.performance = self._load_performance()
         self.knowledge = self._load_knowledge()
+        self._tool_registry = None  # built on first tool-enabled chat turn
 
     def _load_profile(self) -> str:
         path = self.worker_dir / "profile.md"
@@ -52,7 +61,7 @@ class Worker:
         path = self.worker_dir / "skills.yaml"
         if path.exists():
             try:
-                return yaml.safe_load(path.read_text()) or {}
+                return safe_load_yaml(path.read_text()) or {}
             except yaml.YAMLError:
                 return {}
         return {}
@@ -61,7 +70,7 @@ class Worker:
         path = self.worker_dir / "config.yaml"
         if path.exists():
             try:
-                return yaml.safe_load(path.read_text()) or {}
+                return safe_load_yaml(path.read_text()) or {}
             except yaml.YAMLError:
                 return {}
         return {}
@@ -75,6 +84,20 @@ class Worker:
             return KnowledgeBase.load(kb_dir)
         return KnowledgeBase(kb_dir)
 
+    def _get_tool_registry(self):
+        """Built-in + custom plugin tools, loaded once and reused across chat turns."""
+        if self._tool_registry is None:
+            from framework.plugins import create_default_registry, load_custom_plugins
+
+            registry = create_default_registry()
+
+            # Load custom plugins if plugins/ dir exists
+            plugins_dir = self.project_dir / "plugins"
+            if plugins_dir.exists():
+                load_custom_plugins(plugins_dir, registry)
+            self._tool_registry = registry
+        return self._tool_registry
+
     @property
     def level(self) -> int:
         return self.worker_config.get("level", self.config.worker_defaults.starting_level)
@@ -183,17 +206,9 @@ class Worker:
         # Check if tools are enabled and available for this worker
         tools_config = self.config.tools
         if tools_config.enabled:
-            from framework.plugins import (
-                ToolContext, ToolRegistry, create_default_registry,
-                load_custom_plugins, tool_loop,
-            )
-
-            registry = create_default_registry()
+            from framework.plugins import ToolContext, ToolRegistry, tool_loop
 
-            # Load custom plugins if plugins/ dir exists
-            plugins_dir = self.project_dir / "plugins"
-            if plugins_dir.exists():
-                load_custom_plugins(plugins_dir, registry)
+            registry = self._get_tool_registry()
 
             # Resolve tools for this worker's level
             explicit_tools = self.worker_config.get("tools")
@@ -22,10 +22,13 @@ from framework.hr import HR
 from framework.log import get_logger
 from framework.router import Router
 from framework.task_router import TaskRouter
+from framework.validation import safe_load_yaml
 from framework.worker import Worker
 
 logger = get_logger(__name__)
 
+_OUTPUT_REF_RE = re.compile(r"\{(\w+)\.output\}")
+
 
 @dataclass
 class WorkflowNode:
@@ -53,7 +56,7 @@ class Workflow:
             raise WorkflowError("unknown", f"Workflow file not found: {path}")
 
         try:
-            raw = yaml.safe_load(path.read_text())
+            raw = safe_load_yaml(path.read_text())
         except yaml.YAMLError as e:
             raise WorkflowError("unknown", f"Invalid YAML: {e}")
 
@@ -152,7 +155,7 @@ def _substitute_outputs(message: str, node_results: dict) -> str:
         result = node_results.get(node_id, {})
         return result.get("output", f"{{{{ {node_id}.output not available }}}}")
 
-    return re.sub(r"\{(\w+)\.output\}", replacer, message)
+    return _OUTPUT_REF_RE.sub(replacer, message)
 
 
 def _check_condition(condition: str, depends_on: list[str], node_results: dict) -> bool:
@@ -5,6 +5,7 @@ import asyncio
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
@@ -17,6 +18,11 @@ from telegram.ext import (
     filters,
 )
 
+try:
+    import uvloop  # optional libuv event loop (Linux/macOS)
+except ImportError:
+    uvloop = None
+
 from framework.accountant import Accountant
 from framework.config import ProjectConfig
 from framework.events import EventLog
@@ -26,15 +32,102 @@ from framework.hr import HR
 from framework.router import Router
 from framework.scheduler import Scheduler
 from framework.task_router import TaskRouter
-from framework.validation import validate_worker_name
-from framework.worker import Worker
+from framework.validation import safe_load_json, safe_write_json, validate_worker_name
+from framework.worker import Worker, level_title
 from framework.workflow import WorkflowEngine
 
 logger = logging.getLogger(__name__)
 
-# Per-user active worker state (resets on restart)
+# Per-user active worker state, mirrored to data/bot_sessions.json so a
+# restart doesn't drop everyone's /chat selection
 _user_workers: dict[int, str] = {}
 
+# Loaded workers, reused while their files are unchanged: worker_dir -> (stamp, Worker)
+_worker_cache: dict[Path, tuple[tuple, Worker]] = {}
+# Handlers call _get_worker from worker threads; one build per miss, so two
+# messages to the same worker share one object and one memory list
+_worker_cache_lock = threading.Lock()
+_WORKER_FILES = ("profile.md", "memory.json", "skills.yaml", "config.yaml",
+                 "performance.json", "knowledge_base/knowledge.json")
+# Files a Worker writes itself during chat()
+_WORKER_OWN_FILES = ("memory.json", "performance.json")
+
+
+def _worker_stamp(worker_dir: Path) -> tuple:
+    """(mtime_ns, size) of each file a Worker loads; None for missing files."""
+    stamp = []
+    for name in _WORKER_FILES:
+        try:
+            st = (worker_dir / name).stat()
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+def _get_worker(name: str) -> Worker:
+    """Return the Worker for name, loading it from disk only if its files changed.
+
+    Raises WorkerNotFound like the Worker constructor.
+    """
+    worker_dir = _project_dir / "workers" / name
+    with _worker_cache_lock:
+        stamp = _worker_stamp(worker_dir)
+        cached = _worker_cache.get(worker_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            worker = Worker(name, _project_dir, _config)
+        except WorkerNotFound:
+            _worker_cache.pop(worker_dir, None)  # fired: don't keep the old object alive
+            raise
+        _worker_cache[worker_dir] = (stamp, worker)
+        return worker
+
+
+def _refresh_worker_stamp(name: str) -> None:
+    """Re-stamp a cached worker after it wrote its own memory/performance files.
+
+    Its in-memory state already includes those writes, so they shouldn't
+    force a reload on the next message. Only those entries are refreshed; an
+    outside edit to any other file still triggers a reload.
+    """
+    worker_dir = _project_dir / "workers" / name
+    with _worker_cache_lock:
+        cached = _worker_cache.get(worker_dir)
+        if cached is None:
+            return
+        current = _worker_stamp(worker_dir)
+        stamp = tuple(
+            current[i] if fname in _WORKER_OWN_FILES else old
+            for i, (fname, old) in enumerate(zip(_WORKER_FILES, cached[0]))
+        )
+        _worker_cache[worker_dir] = (stamp, cached[1])
+
+
+def _sessions_path() -> Path:
+    return _project_dir / "data" / "bot_sessions.json"
+
+
+def _load_sessions() -> dict[int, str]:
+    """Read saved user -> worker selections; JSON keys come back as strings."""
+    data = safe_load_json(_sessions_path(), default={})
+    if not isinstance(data, dict):
+        return {}
+    sessions = {}
+    for user_id, worker_name in data.items():
+        try:
+            sessions[int(user_id)] = str(worker_name)
+        except (TypeError, ValueError):
+            continue
+    return sessions
+
+
+def _save_sessions() -> None:
+    """Persist _user_workers; called after every change to it."""
+    safe_write_json(_sessions_path(), {str(k): v for k, v in _user_workers.items()})
+
 
 def _load_project(project_dir: Path) -> tuple[ProjectConfig, Accountant, Router, HR]:
     config = ProjectConfig.load(project_dir)
@@ -50,11 +143,15 @@ _accountant: Accountant | None = None
 _router: Router | None = None
 _hr: HR | None = None
 _project_dir: Path | None = None
+_event_log: EventLog | None = None
+_scheduler: Scheduler | None = None
+_workflow_engine: WorkflowEngine | None = None
+_task_router: TaskRouter | None = None
 
 
 async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /start command."""
-    worker_list = _hr.list_workers()
+    worker_list = await asyncio.to_thread(_hr.list_workers)
     if worker_list:
         names = ", ".join(w["name"] for w in worker_list)
         text = (
@@ -75,17 +172,12 @@ async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 async def cmd_workers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /workers command."""
-    worker_list = _hr.list_workers()
+    worker_list = await asyncio.to_thread(_hr.list_workers)
     if not worker_list:
         await update.message.reply_text("No workers hired yet.")
         return
 
-    seniority = {1: "Intern", 2: "Junior", 3: "Mid", 4: "Senior", 5: "Principal"}
-    lines = []
-    for w in worker_list:
-        title = seniority.get(w["level"], f"L{w['level']}")
-        lines.append(f"• {w['name']} — {title} — {w['role']}")
-
+    lines = [f"• {w['name']} — {level_title(w['level'])} — {w['role']}" for w in worker_list]
     await update.message.reply_text("Workers:\n" + "\n".join(lines))
 
 
@@ -111,12 +203,13 @@ async def cmd_chat(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     user_id = update.effective_user.id
     _user_workers[user_id] = worker_name
+    await asyncio.to_thread(_save_sessions)
     await update.message.reply_text(f"Now chatting with {worker_name}. Send a message!")
 
 
 async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /status command."""
-    report = _accountant.daily_report()
+    report = await asyncio.to_thread(_accountant.daily_report)
     text = (
         f"Project: {_config.name}\n"
         f"Owner: {_config.owner}\n"
@@ -130,7 +223,7 @@ async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 
 async def cmd_budget(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /budget command."""
-    report = _accountant.daily_report()
+    report = await asyncio.to_thread(_accountant.daily_report)
     lines = [
         f"Date: {report['date']}",
         f"Spent: ${report['total_spent']:.4f} / ${report['daily_limit']:.2f}",
@@ -141,8 +234,7 @@ async def cmd_budget(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     ]
     if report["by_worker"]:
         lines.append("\nBy worker:")
-        for w, cost in sorted(report["by_worker"].items()):
-            lines.append(f"  {w}: ${cost:.4f}")
+        lines.extend(f"  {w}: ${cost:.4f}" for w, cost in sorted(report["by_worker"].items()))
     await update.message.reply_text("\n".join(lines))
 
 
@@ -182,19 +274,15 @@ async def handle_fire_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     await query.answer()
 
     data = query.data  # "fire_yes_<name>" or "fire_no_<name>"
-    parts = data.split("_", 2)
-    action = parts[1]
-    worker_name = parts[2]
-
-    if action == "no":
-        await query.edit_message_text(f"Cancelled firing '{worker_name}'.")
+    if data.startswith("fire_no_"):
+        await query.edit_message_text(f"Cancelled firing '{data.removeprefix('fire_no_')}'.")
         return
-
-    event_log = EventLog(_project_dir / "data" / "events.json")
-    scheduler = Scheduler(_config, _accountant, _router, event_log)
+    if not data.startswith("fire_yes_"):
+        return
+    worker_name = data.removeprefix("fire_yes_")
 
     try:
-        result = _hr.fire(worker_name, confirm=True, scheduler=scheduler)
+        result = await asyncio.to_thread(_hr.fire, worker_name, confirm=True, scheduler=_scheduler)
     except WorkerNotFound:
         await query.edit_message_text(f"Worker '{worker_name}' not found.")
         return
@@ -216,11 +304,11 @@ async def cmd_review(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         except ValidationError:
             await update.message.reply_text("Invalid worker name.")
             return
-        worker_dir = _project_dir / "workers" / worker_name
-        if not worker_dir.exists():
+        try:
+            worker = await asyncio.to_thread(_get_worker, worker_name)
+        except WorkerNotFound:
             await update.message.reply_text(f"Worker '{worker_name}' not found.")
             return
-        worker = Worker(worker_name, _project_dir, _config)
         summary = worker.performance_summary()
         text = (
             f"{worker_name}:\n"
@@ -231,14 +319,13 @@ async def cmd_review(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         )
         await update.message.reply_text(text)
     else:
-        results = _hr.team_review()
+        results = await asyncio.to_thread(_hr.team_review, 10)
         if not results:
             await update.message.reply_text("No workers to review.")
             return
-        seniority = {1: "Intern", 2: "Junior", 3: "Mid", 4: "Senior", 5: "Principal"}
         lines = []
-        for r in results[:10]:
-            title = seniority.get(r["level"], f"L{r['level']}")
+        for r in results:
+            title = level_title(r["level"])
             lines.append(f"  {r['name']} — {title} — avg {r['avg_rating']} ({r['task_count']} tasks)")
         await update.message.reply_text("Team review:\n" + "\n".join(lines))
 
@@ -250,15 +337,15 @@ async def cmd_delegate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
 
     message = " ".join(context.args)
-    task_router = TaskRouter(_config, _hr)
-    selected = task_router.select_worker(message)
+    selected = await asyncio.to_thread(_task_router.select_worker, message)
     if selected is None:
         await update.message.reply_text("No workers available.")
         return
 
     try:
-        worker = Worker(selected, _project_dir, _config)
+        worker = await asyncio.to_thread(_get_worker, selected)
         response, _ = await asyncio.to_thread(worker.chat, message, _router)
+        await asyncio.to_thread(_refresh_worker_stamp, selected)
         await update.message.reply_text(f"{selected}: {response}")
     except BudgetExceeded as e:
         await update.message.reply_text(f"Budget exceeded: {e}")
@@ -275,8 +362,8 @@ async def cmd_events(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         except ValueError:
             pass
 
-    event_log = EventLog(_project_dir / "data" / "events.json")
-    results = event_log.query(limit=limit)
+    # Only the newest 10 are shown
+    results = await asyncio.to_thread(_event_log.query, limit=min(limit, 10))
     if not results:
         await update.message.reply_text("No events.")
         return
@@ -289,9 +376,7 @@ async def cmd_events(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 
 async def cmd_schedule(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /schedule — list scheduled tasks."""
-    event_log = EventLog(_project_dir / "data" / "events.json")
-    scheduler = Scheduler(_config, _accountant, _router, event_log)
-    tasks = scheduler.list_tasks()
+    tasks = await asyncio.to_thread(_scheduler.list_tasks)
     if not tasks:
         await update.message.reply_text("No scheduled tasks.")
         return
@@ -305,9 +390,7 @@ async def cmd_schedule(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 async def cmd_workflow(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /workflow — recent workflow runs."""
-    event_log = EventLog(_project_dir / "data" / "events.json")
-    engine = WorkflowEngine(_config, _accountant, _router, event_log)
-    runs = engine.list_runs()
+    runs = await asyncio.to_thread(_workflow_engine.list_runs)
     if not runs:
         await update.message.reply_text("No workflow runs.")
         return
@@ -327,13 +410,12 @@ async def cmd_inspect(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         except ValidationError:
             await update.message.reply_text("Invalid worker name.")
             return
-        worker_dir = _project_dir / "workers" / worker_name
-        if not worker_dir.exists():
+        try:
+            worker = await asyncio.to_thread(_get_worker, worker_name)
+        except WorkerNotFound:
             await update.message.reply_text(f"Worker '{worker_name}' not found.")
             return
-        worker = Worker(worker_name, _project_dir, _config)
-        seniority = {1: "Intern", 2: "Junior", 3: "Mid", 4: "Senior", 5: "Principal"}
-        title = seniority.get(worker.level, f"L{worker.level}")
+        title = level_title(worker.level)
         text = (
             f"{worker_name}:\n"
             f"  Level: {title} (L{worker.level}, tier={worker.get_tier()})\n"
@@ -343,8 +425,11 @@ async def cmd_inspect(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         await update.message.reply_text(text)
     else:
-        report = _accountant.daily_report()
-        worker_list = _hr.list_workers()
+        # Spending DB and worker files are independent; read both off the event loop
+        report, worker_list = await asyncio.gather(
+            asyncio.to_thread(_accountant.daily_report),
+            asyncio.to_thread(_hr.list_workers),
+        )
         text = (
             f"Project: {_config.name}\n"
             f"Budget: ${report['total_spent']:.4f} / ${report['daily_limit']:.2f} ({report['status']})\n"
@@ -377,15 +462,17 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     try:
-        worker = Worker(worker_name, _project_dir, _config)
+        worker = await asyncio.to_thread(_get_worker, worker_name)
     except WorkerNotFound:
         await update.message.reply_text(f"Worker '{worker_name}' no longer exists.")
         _user_workers.pop(user_id, None)
+        await asyncio.to_thread(_save_sessions)
         return
 
     user_text = update.message.text
     try:
         response, _ = await asyncio.to_thread(worker.chat, user_text, _router)
+        await asyncio.to_thread(_refresh_worker_stamp, worker_name)
         await update.message.reply_text(response)
     except BudgetExceeded as e:
         await update.message.reply_text(f"Budget exceeded: {e}")
@@ -399,6 +486,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 def main(project_dir: Path | None = None) -> None:
     """Start the Telegram bot."""
     global _config, _accountant, _router, _hr, _project_dir
+    global _event_log, _scheduler, _workflow_engine, _task_router
 
     if project_dir is None:
         project_dir = Path.cwd()
@@ -410,6 +498,15 @@ def main(project_dir: Path | None = None) -> None:
         print(f"Config error: {e}", file=sys.stderr)
         sys.exit(1)
 
+    _user_workers.clear()
+    _user_workers.update(_load_sessions())
+
+    # Built once and shared by all handlers
+    _event_log = EventLog(project_dir / "data" / "events.db")
+    _scheduler = Scheduler(_config, _accountant, _router, _event_log)
+    _workflow_engine = WorkflowEngine(_config, _accountant, _router, _event_log)
+    _task_router = TaskRouter(_config, _hr, load_worker=_get_worker)
+
     token = os.environ.get("TELEGRAM_BOT_TOKEN", "")
     if not token:
         print("TELEGRAM_BOT_TOKEN not set in .env", file=sys.stderr)
@@ -434,8 +531,25 @@ def main(project_dir: Path | None = None) -> None:
     app.add_handler(CallbackQueryHandler(handle_fire_callback, pattern="^fire_"))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
 
+    if uvloop is not None:
+        asyncio.set_event_loop(uvloop.new_event_loop())  # run_polling/run_webhook reuse it
+
+    # Push delivery when a public URL is configured; long polling otherwise
+    webhook_url = os.environ.get("TELEGRAM_WEBHOOK_URL", "").rstrip("/")
     print(f"Bot starting for project: {_config.name}")
-    app.run_polling()
+    try:
+        if webhook_url:
+            app.run_webhook(
+                listen="0.0.0.0",
+                port=int(os.environ.get("PORT", "8443")),
+                url_path=token,
+                webhook_url=f"{webhook_url}/{token}",
+                secret_token=os.environ.get("TELEGRAM_WEBHOOK_SECRET") or None,
+            )
+        else:
+            app.run_polling()
+    finally:
+        _router.close()
 
 
 if __name__ == "__main__":
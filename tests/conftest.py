@@ -71,12 +71,16 @@ CHARTER_YAML = {
     },
 }
 
+# Serialised once; every tmp_project writes the same charter
+_CHARTER_TEXT = yaml.dump(CHARTER_YAML)
+_TEMPLATE_CONFIG_TEXT = yaml.dump({"level": 1, "max_context_tokens": 2000})
+
 
 @pytest.fixture
 def tmp_project(tmp_path):
     """Create a temporary project directory with charter.yaml."""
     charter_path = tmp_path / "charter.yaml"
-    charter_path.write_text(yaml.dump(CHARTER_YAML))
+    charter_path.write_text(_CHARTER_TEXT)
     (tmp_path / "data").mkdir()
     (tmp_path / "workers").mkdir()
     (tmp_path / "templates").mkdir()
@@ -110,7 +114,7 @@ def hr(config, tmp_project):
 @pytest.fixture
 def event_log(tmp_project):
     """Create an EventLog in the temp project."""
-    return EventLog(tmp_project / "data" / "events.json")
+    return EventLog(tmp_project / "data" / "events.db")
 
 
 @pytest.fixture
@@ -121,7 +125,7 @@ def create_template(tmp_project):
         tpl_dir.mkdir(parents=True, exist_ok=True)
         (tpl_dir / "profile.md").write_text(f"# {name}\nA {name} worker.")
         (tpl_dir / "skills.yaml").write_text(yaml.dump({"role": name, "skills": [name]}))
-        (tpl_dir / "config.yaml").write_text(yaml.dump({"level": 1, "max_context_tokens": 2000}))
+        (tpl_dir / "config.yaml").write_text(_TEMPLATE_CONFIG_TEXT)
         return tpl_dir
     return _create
 
@@ -1,6 +1,7 @@
 """Tests for framework/accountant.py."""
 
 import threading
+from unittest.mock import patch
 
 import pytest
 
@@ -78,6 +79,35 @@ class TestAccountant:
         assert report["by_model"]["model-b"] == pytest.approx(0.20)
         assert report["total_tokens_in"] == 450
         assert report["total_tokens_out"] == 225
+        assert report["status"] == "green"
+
+    def test_daily_report_status_single_read(self, accountant):
+        """Status comes from the same records as the totals; the ledger is searched once."""
+        accountant.record_call("m", 0, 0, 2.50, "w")
+        with patch.object(accountant.table, "search", wraps=accountant.table.search) as search:
+            report = accountant.daily_report()
+        assert report["status"] == "austerity"
+        assert report["usage_ratio"] == pytest.approx(2.50 / 3.00)
+        assert search.call_count == 1
+
+        accountant.record_call("m", 0, 0, 1.00, "w")
+        assert accountant.daily_report()["status"] == "frozen"
+
+    def test_sees_spending_from_other_processes(self, accountant):
+        """A write by another handle on the ledger file invalidates the query cache."""
+        from tinydb import TinyDB
+
+        accountant.record_call("m", 0, 0, 0.50, "w")
+        assert accountant.today_spent() == pytest.approx(0.50)
+
+        other = TinyDB(accountant.db_path)  # stands in for the CLI or scheduler
+        other.table("spending").insert({
+            "date": accountant._today(), "model": "m", "cost": 0.25, "worker": "cli",
+        })
+        other.close()
+
+        assert accountant.today_spent() == pytest.approx(0.75)
+        assert accountant.daily_report()["by_worker"]["cli"] == pytest.approx(0.25)
 
 
 class TestAccountantThreadSafety:
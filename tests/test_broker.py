@@ -1,17 +1,18 @@
 """Tests for framework/broker.py — paper trading broker."""
 
+import json
 import threading
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from framework.broker import Broker, INITIAL_CASH
+from framework.broker import Broker, INITIAL_CASH, PRICE_TTL
 from framework.exceptions import BrokerError
 
 
 @pytest.fixture
 def broker(tmp_path):
-    return Broker(db_path=tmp_path / "broker.json")
+    return Broker(db_path=tmp_path / "broker.db")
 
 
 class TestBrokerAccount:
@@ -150,6 +151,41 @@ class TestBrokerTrades:
         assert len(trades) == 1
         assert trades[0]["symbol"] == "AAPL"
 
+    def test_get_trades_limit(self, broker):
+        """Limit is applied after newest-first ordering."""
+        for price in (100.0, 101.0, 102.0):
+            broker.place_trade("AAPL", "buy", 1, price=price)
+        trades = broker.get_trades(symbol="aapl", limit=2)
+        assert [t["price"] for t in trades] == [102.0, 101.0]
+
+
+class TestBrokerMigration:
+    def test_migrates_legacy_json(self, tmp_path):
+        """A TinyDB broker.json is imported once and moved aside."""
+        legacy = tmp_path / "broker.json"
+        legacy.write_text(json.dumps({
+            "account": {"1": {"cash": 8500.0, "initial": INITIAL_CASH}},
+            "positions": {"1": {"symbol": "AAPL", "quantity": 10, "avg_price": 150.0}},
+            "trades": {"1": {"id": "abc12345", "timestamp": "2026-01-01T00:00:00+00:00",
+                             "symbol": "AAPL", "side": "buy", "quantity": 10,
+                             "price": 150.0, "total": 1500.0}},
+        }))
+
+        broker = Broker(db_path=tmp_path / "broker.db")
+        assert broker.get_account()["cash"] == pytest.approx(8500.0)
+        assert broker.get_positions() == [{"symbol": "AAPL", "quantity": 10, "avg_price": 150.0}]
+        assert broker.get_trades()[0]["id"] == "abc12345"
+        assert not legacy.exists()
+        assert (tmp_path / "broker.json.migrated").exists()
+
+    def test_failed_trade_rolls_back(self, broker):
+        """A rejected sell leaves cash and positions untouched."""
+        broker.place_trade("AAPL", "buy", 5, price=100.0)
+        with pytest.raises(BrokerError):
+            broker.place_trade("AAPL", "sell", 10, price=100.0)
+        assert broker.get_account()["cash"] == pytest.approx(INITIAL_CASH - 500.0)
+        assert len(broker.get_trades()) == 1
+
 
 class TestBrokerPrice:
     def test_get_price_without_yfinance(self, broker):
@@ -158,6 +194,45 @@ class TestBrokerPrice:
             with pytest.raises(BrokerError, match="yfinance not installed"):
                 broker.get_price("AAPL")
 
+    def test_explicit_price_skips_lookup(self, broker):
+        """A priced trade never touches yfinance."""
+        with patch.object(Broker, "get_price", side_effect=AssertionError("price lookup")), \
+                patch.dict("sys.modules", {"yfinance": None}):
+            trade = broker.place_trade("AAPL", "buy", 1, price=100.0)
+        assert trade.price == 100.0
+
+    def test_get_price_cached_within_ttl(self, broker, tmp_path):
+        """Second lookup within the TTL skips yfinance, also across Broker instances."""
+        with patch.object(Broker, "_fetch_price", return_value=123.0) as fetch:
+            assert broker.get_price("aapl") == 123.0
+            assert broker.get_price("AAPL") == 123.0
+            assert Broker(db_path=tmp_path / "broker.db").get_price("AAPL") == 123.0
+        assert fetch.call_count == 1
+
+    def test_get_price_refetches_after_ttl(self, broker):
+        """Stale quotes are refreshed."""
+        with patch.object(Broker, "_fetch_price", side_effect=[100.0, 105.0]) as fetch:
+            with patch("framework.broker.time.time", return_value=1000.0):
+                assert broker.get_price("AAPL") == 100.0
+            with patch("framework.broker.time.time", return_value=1000.0 + PRICE_TTL):
+                assert broker.get_price("AAPL") == 105.0
+        assert fetch.call_count == 2
+
+    def test_concurrent_lookups_fetch_once(self, broker):
+        """Threads racing on a cold quote share one yfinance fetch."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def slow_fetch(symbol):
+            time.sleep(0.05)
+            return 42.0
+
+        with patch.object(Broker, "_fetch_price", side_effect=slow_fetch) as fetch:
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                prices = list(pool.map(lambda _: broker.get_price("MSFT"), range(5)))
+        assert prices == [42.0] * 5
+        assert fetch.call_count == 1
+
 
 class TestBrokerConcurrency:
     def test_concurrent_trades(self, broker):
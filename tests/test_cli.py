@@ -1,6 +1,10 @@
 """Tests for scripts/corp.py CLI."""
 
+import json
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import httpx
@@ -12,7 +16,7 @@ from click.testing import CliRunner
 from framework.exceptions import TrainingError
 from framework.registry import OperationRegistry
 from framework.router import OPENROUTER_API_URL
-from scripts.corp import cli
+from scripts.corp import _Project, _trunc, cli
 
 
 @pytest.fixture
@@ -20,6 +24,29 @@ def runner():
     return CliRunner()
 
 
+class TestCLIStartup:
+    def test_import_defers_subsystems(self):
+        """Importing the CLI doesn't pull in the router, HR, scheduler or workflow engine."""
+        code = (
+            "import sys, scripts.corp; "
+            "heavy = {'framework.router', 'framework.hr', 'framework.scheduler', "
+            "'framework.workflow', 'httpx', 'yaml'}; "
+            "print(sorted(heavy & set(sys.modules)))"
+        )
+        root = Path(__file__).resolve().parent.parent
+        out = subprocess.run([sys.executable, "-c", code], cwd=root,
+                             capture_output=True, text=True, check=True).stdout
+        assert out.strip() == "[]"
+
+    def test_project_builds_components_on_access(self, tmp_project):
+        """_Project loads config eagerly but nothing else until asked."""
+        project = _Project(tmp_project)
+        assert project.config.name == "Test Project"
+        assert not {"accountant", "router", "hr", "event_log"} & set(vars(project))
+        assert project.router.accountant is project.accountant
+        assert "hr" not in vars(project)
+
+
 class TestCLIStatus:
     def test_status_shows_project_info(self, runner, tmp_project):
         """exit 0, output has project name + budget."""
@@ -34,6 +61,90 @@ class TestCLIStatus:
         assert result.exit_code == 1
         assert "Config error" in result.output
 
+    def test_project_dir_missing(self, runner, tmp_path):
+        """Nonexistent --project-dir is a usage error."""
+        result = runner.invoke(cli, ["--project-dir", str(tmp_path / "nope"), "status"])
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+
+
+class TestConfigCache:
+    def test_config_cache_reused_until_charter_changes(self, tmp_project):
+        """Read-only loads reuse data/.config.json keyed on charter mtime/size."""
+        from scripts.corp import _config_memo, _load_config
+        first = _load_config(tmp_project, cached=True)
+        assert (tmp_project / "data" / ".config.json").exists()
+
+        _config_memo.clear()  # force the on-disk path
+        with patch("framework.config.ProjectConfig.load") as load:
+            again = _load_config(tmp_project, cached=True)
+        load.assert_not_called()
+        assert again == first
+
+        charter = yaml.safe_load((tmp_project / "charter.yaml").read_text())
+        charter["project"]["name"] = "Renamed Project"
+        (tmp_project / "charter.yaml").write_text(yaml.dump(charter))
+        assert _load_config(tmp_project, cached=True).name == "Renamed Project"
+
+    def test_config_cache_invalidated_by_framework_change(self, tmp_project, tmp_path):
+        """A changed framework/config.py invalidates caches written by the old code."""
+        import scripts.corp as corp
+        fake_module = tmp_path / "config.py"
+        fake_module.write_text("# v1\n")
+        with patch.object(corp, "_CONFIG_MODULE", fake_module):
+            before = corp._config_cache_key(tmp_project)
+            fake_module.write_text("# v2, longer\n")
+            assert corp._config_cache_key(tmp_project) != before
+
+    def test_config_cache_never_unpickles(self, tmp_project):
+        """A planted pickle in data/ is never loaded; stale caches just rebuild."""
+        import pickle
+        from scripts.corp import _config_memo, _load_config
+        data_dir = tmp_project / "data"
+        data_dir.mkdir(exist_ok=True)
+        (data_dir / ".config.cache").write_bytes(pickle.dumps({"planted": True}))
+        (data_dir / ".config.json").write_text('{"key": "bogus", "config": {}}')
+        _config_memo.clear()
+        with patch("pickle.loads") as loads, patch("pickle.load") as load:
+            config = _load_config(tmp_project, cached=True)
+        loads.assert_not_called()
+        load.assert_not_called()
+        assert config.name
+        assert not (data_dir / ".config.cache").exists()
+
+    def test_config_cache_hit_still_warns_on_loose_env(self, tmp_project, monkeypatch):
+        """A cache hit re-checks .env permissions, since chmod doesn't change the key."""
+        import warnings
+        from scripts.corp import _config_memo, _load_config
+        monkeypatch.delenv("CORP_CACHE_TEST", raising=False)
+        env_file = tmp_project / ".env"
+        env_file.write_text("CORP_CACHE_TEST=1\n")
+        env_file.chmod(0o600)
+        _config_memo.clear()
+        _load_config(tmp_project, cached=True)
+
+        env_file.chmod(0o644)
+        _config_memo.clear()
+        with warnings.catch_warnings(record=True) as w, \
+                patch("framework.config.ProjectConfig.load") as load:
+            warnings.simplefilter("always")
+            _load_config(tmp_project, cached=True)
+        load.assert_not_called()
+        assert [x for x in w if "group/other readable" in str(x.message)]
+
+    def test_config_memoized_in_process(self, tmp_project):
+        """Repeat loads in one process return the same object until charter.yaml changes."""
+        from scripts.corp import _load_config
+        first = _load_config(tmp_project)
+        with patch("framework.config.ProjectConfig.load") as load:
+            assert _load_config(tmp_project) is first
+            assert _load_config(tmp_project, cached=True) is first
+        load.assert_not_called()
+
+        (tmp_project / "charter.yaml").write_text(
+            (tmp_project / "charter.yaml").read_text() + "\n# edited\n")
+        assert _load_config(tmp_project) is not first
+
 
 class TestCLIBudget:
     def test_budget_shows_report(self, runner, tmp_project):
@@ -175,7 +286,6 @@ class TestCLIKnowledge:
         # Create knowledge entries
         kb_dir = tmp_project / "workers" / "knowledgeable" / "knowledge_base"
         kb_dir.mkdir()
-        import json
         from framework.knowledge import KnowledgeEntry
         from dataclasses import asdict
         entries = [
@@ -188,12 +298,26 @@ class TestCLIKnowledge:
         assert "1 knowledge entries" in result.output
         assert "doc.txt" in result.output
 
+    def test_knowledge_counts_chunks_per_source(self, runner, tmp_project, create_worker):
+        """Sources are listed alphabetically with their chunk counts."""
+        create_worker("reader")
+        kb_dir = tmp_project / "workers" / "reader" / "knowledge_base"
+        kb_dir.mkdir()
+        (kb_dir / "knowledge.json").write_text(json.dumps([
+            {"source": "b.md", "type": "markdown", "content": "one", "chunk_index": 0},
+            {"source": "a.txt", "type": "text", "content": "two", "chunk_index": 0},
+            {"source": "b.md", "type": "markdown", "content": "three", "chunk_index": 1},
+        ]))
+
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "knowledge", "reader"])
+        assert result.exit_code == 0
+        assert result.output.splitlines()[1:] == ["  a.txt — 1 chunks", "  b.md — 2 chunks"]
+
     def test_knowledge_search(self, runner, tmp_project, create_worker):
         """--search filters knowledge entries."""
         create_worker("searcher")
         kb_dir = tmp_project / "workers" / "searcher" / "knowledge_base"
         kb_dir.mkdir()
-        import json
         from framework.knowledge import KnowledgeEntry
         from dataclasses import asdict
         entries = [
@@ -233,6 +357,17 @@ class TestCLIInit:
 
         env_text = (tmp_path / ".env").read_text()
         assert "sk-or-test123" in env_text
+        assert (tmp_path / ".env").stat().st_mode & 0o777 == 0o600
+
+    def test_init_tightens_existing_env(self, runner, tmp_path):
+        """A pre-existing world-readable .env is rewritten as owner-only."""
+        (tmp_path / ".env").write_text("OLD=1\n")
+        (tmp_path / ".env").chmod(0o644)
+        user_input = "Proj\nOwner\nMission\n3.00\nsk-or-new\n"
+        result = runner.invoke(cli, ["--project-dir", str(tmp_path), "init"], input=user_input)
+        assert result.exit_code == 0
+        assert (tmp_path / ".env").read_text() == "OPENROUTER_API_KEY=sk-or-new\n"
+        assert (tmp_path / ".env").stat().st_mode & 0o777 == 0o600
 
     def test_init_creates_directories(self, runner, tmp_path):
         """workers/, templates/, data/ dirs created."""
@@ -287,6 +422,46 @@ class TestCLIInspect:
         assert "worker1" in result.output
         assert "analyst" in result.output
 
+    def test_inspect_project_counts(self, runner, tmp_project, create_worker):
+        """Counts come from the JSON files; corrupt files count as 0."""
+        wdir = create_worker("counter")
+        (wdir / "memory.json").write_text('[{"type": "note"}, {"type": "note"}]')
+        (wdir / "performance.json").write_text("{not json")
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "inspect"])
+        assert result.exit_code == 0
+        assert "memory: 2, knowledge: 0, tasks: 0" in result.output
+
+    def test_inspect_counts_stay_with_their_worker(self, runner, tmp_project, create_worker):
+        """Counts gathered concurrently still line up with the right worker."""
+        for i in range(12):
+            wdir = create_worker(f"w{i:02d}")
+            (wdir / "memory.json").write_text(json.dumps([{}] * i))
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "inspect"])
+        assert result.exit_code == 0
+        rows = [line for line in result.output.splitlines() if line.startswith("  w")]
+        assert len(rows) == 12
+        for i, row in enumerate(rows):
+            assert row.startswith(f"  w{i:02d} ") and f"memory: {i}," in row
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_count_json_array(self, tmp_path, streaming):
+        """Same counts with and without ijson installed."""
+        import scripts.corp as corp
+        good = tmp_path / "good.json"
+        good.write_text('[{"a": [1, 2]}, "x", 3.5]')
+        truncated = tmp_path / "truncated.json"
+        truncated.write_text('[{"a": 1}, {"b"')
+        non_finite = tmp_path / "non_finite.json"
+        non_finite.write_text('[1.0, NaN, Infinity]')
+        ijson_mod = corp._ijson if streaming else None
+        if streaming and ijson_mod is None:
+            pytest.skip("ijson not installed")
+        with patch.object(corp, "_ijson", ijson_mod):
+            assert corp._count_json_array(good) == 3
+            assert corp._count_json_array(truncated) == 0
+            assert corp._count_json_array(non_finite) == 3
+            assert corp._count_json_array(tmp_path / "missing.json") == 0
+
     def test_inspect_project_no_workers(self, runner, tmp_project):
         """No workers → shows 'none'."""
         result = runner.invoke(cli, ["--project-dir", str(tmp_project), "inspect"])
@@ -377,6 +552,25 @@ class TestCLIDaemon:
         assert result.exit_code == 1
         assert "not running" in result.output
 
+    def test_daemon_stop_waits_for_exit(self, runner, tmp_project):
+        """Returns as soon as the process exits rather than after a fixed poll."""
+        import time
+        proc = subprocess.Popen(["sleep", "30"])
+        pid_path = tmp_project / "data" / "daemon.pid"
+        pid_path.write_text(str(proc.pid))
+        try:
+            start = time.monotonic()
+            result = runner.invoke(cli, ["--project-dir", str(tmp_project), "daemon", "stop"])
+            elapsed = time.monotonic() - start
+        finally:
+            proc.kill()
+            proc.wait()
+        assert result.exit_code == 0
+        assert f"Daemon stopped (PID {proc.pid})" in result.output
+        assert not pid_path.exists()
+        if hasattr(os, "pidfd_open"):
+            assert elapsed < 2.0
+
     def test_daemon_start_already_running(self, runner, tmp_project):
         """exit 1 when PID file exists with live process (self)."""
         pid_path = tmp_project / "data" / "daemon.pid"
@@ -386,6 +580,208 @@ class TestCLIDaemon:
         assert result.exit_code == 1
         assert "already running" in result.output
 
+    def test_daemon_status_reads_only_pid_file(self, runner, tmp_project):
+        """status never loads the charter or opens project databases."""
+        from scripts.corp import _pid_file_path, _pid_record
+        _pid_file_path(tmp_project).write_text(_pid_record(os.getpid()))
+        with patch("scripts.corp._load_config", side_effect=AssertionError("config loaded")), \
+                patch("framework.db.get_db", side_effect=AssertionError("db opened")):
+            result = runner.invoke(cli, ["--project-dir", str(tmp_project), "daemon", "status"])
+        assert result.exit_code == 0
+        assert "Daemon is running" in result.output
+
+    def test_daemon_status_running_with_starttime(self, runner, tmp_project):
+        """PID file with matching start time → running."""
+        from scripts.corp import _pid_file_path, _pid_record
+        _pid_file_path(tmp_project).write_text(_pid_record(os.getpid()))
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "daemon", "status"])
+        assert f"Daemon is running (PID {os.getpid()})" in result.output
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs /proc")
+    def test_daemon_status_detects_reused_pid(self, runner, tmp_project):
+        """Live PID with a different start time is treated as stale."""
+        pid_path = tmp_project / "data" / "daemon.pid"
+        pid_path.write_text(f"{os.getpid()} 1")
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "daemon", "status"])
+        assert "stale PID file" in result.output
+        assert not pid_path.exists()
+
+    def test_daemon_start_waits_for_signal(self, runner, tmp_project, create_worker):
+        """Blocks in sigwait, then cleans up the PID file and restores the mask."""
+        import signal
+        create_worker("alice")
+        base = ["--project-dir", str(tmp_project)]
+        runner.invoke(cli, base + ["schedule", "add", "alice", "ping", "--interval", "3600"])
+        mask_before = signal.pthread_sigmask(signal.SIG_BLOCK, [])
+
+        with patch("signal.sigwait", return_value=signal.SIGTERM) as sigwait:
+            result = runner.invoke(cli, base + ["daemon", "start"])
+
+        assert result.exit_code == 0
+        assert "Daemon stopped" in result.output
+        assert "Received SIGTERM, shutting down" in result.output
+        sigwait.assert_called_once_with({signal.SIGTERM, signal.SIGINT, signal.SIGHUP})
+        assert not (tmp_project / "data" / "daemon.pid").exists()
+        assert signal.pthread_sigmask(signal.SIG_BLOCK, []) == mask_before
+
+    def test_daemon_start_refuses_held_lock(self, runner, tmp_project, create_worker):
+        """A second start loses the flock even with no PID file at all."""
+        import fcntl
+        create_worker("alice")
+        base = ["--project-dir", str(tmp_project)]
+        runner.invoke(cli, base + ["schedule", "add", "alice", "ping", "--interval", "3600"])
+        lock_path = tmp_project / "data" / "daemon.lock"
+        holder = os.open(lock_path, os.O_CREAT | os.O_RDWR)
+        # flock locks belong to the open file description, so a second open() conflicts
+        fcntl.flock(holder, fcntl.LOCK_EX)
+        try:
+            result = runner.invoke(cli, base + ["daemon", "start"])
+        finally:
+            os.close(holder)
+        assert result.exit_code == 1
+        assert "already running" in result.output
+        assert not (tmp_project / "data" / "daemon.pid").exists()
+
+    def test_lock_daemon_records_pid(self, tmp_project):
+        from scripts.corp import _lock_daemon, _read_pid
+        pid_path = tmp_project / "data" / "daemon.pid"
+        fd = _lock_daemon(pid_path)
+        try:
+            assert fd is not None
+            assert _read_pid(pid_path)[0] == os.getpid()
+            # Deleting the PID file (as an old `daemon stop` did) must not free the lock
+            pid_path.unlink()
+            assert _lock_daemon(pid_path) is None
+        finally:
+            os.close(fd)
+        assert (tmp_project / "data" / "daemon.lock").exists()
+
+    def test_daemon_stop_keeps_pid_file_if_still_running(self, runner, tmp_project):
+        """A daemon that outlives the timeout keeps its PID file; stop reports failure."""
+        pid_path = tmp_project / "data" / "daemon.pid"
+        pid_path.write_text("4242")
+        with patch("scripts.corp._is_pid_alive", return_value=True), \
+                patch("os.kill"), patch("scripts.corp._wait_for_exit", return_value=False):
+            result = runner.invoke(cli, ["--project-dir", str(tmp_project), "daemon", "stop"])
+        assert result.exit_code == 1
+        assert "still shutting down" in result.output
+        assert pid_path.read_text() == "4242"
+
+    def test_daemon_stop_leaves_new_daemons_pid_file(self, runner, tmp_project):
+        """If another daemon replaced the record meanwhile, stop doesn't delete it."""
+        pid_path = tmp_project / "data" / "daemon.pid"
+        pid_path.write_text("4242")
+
+        def replaced(pid, timeout):
+            pid_path.write_text("5151")
+            return True
+
+        with patch("scripts.corp._is_pid_alive", return_value=True), \
+                patch("os.kill"), patch("scripts.corp._wait_for_exit", side_effect=replaced):
+            result = runner.invoke(cli, ["--project-dir", str(tmp_project), "daemon", "stop"])
+        assert result.exit_code == 0
+        assert pid_path.read_text() == "5151"
+
+    def test_daemon_start_failure_cleans_up(self, runner, tmp_project, create_worker):
+        """A scheduler that fails to start leaves no PID file or blocked signals."""
+        import signal
+        create_worker("alice")
+        base = ["--project-dir", str(tmp_project)]
+        runner.invoke(cli, base + ["schedule", "add", "alice", "ping", "--interval", "3600"])
+        mask_before = signal.pthread_sigmask(signal.SIG_BLOCK, [])
+
+        with patch("framework.scheduler.Scheduler.start", side_effect=RuntimeError("boom")):
+            result = runner.invoke(cli, base + ["daemon", "start"])
+
+        assert isinstance(result.exception, RuntimeError)
+        assert not (tmp_project / "data" / "daemon.pid").exists()
+        assert signal.pthread_sigmask(signal.SIG_BLOCK, []) == mask_before
+
+    def test_daemon_start_background_spawns(self, runner, tmp_project, create_worker):
+        """--background spawns a fresh interpreter in a new session instead of forking."""
+        create_worker("alice")
+        base = ["--project-dir", str(tmp_project)]
+        runner.invoke(cli, base + ["schedule", "add", "alice", "ping", "--interval", "3600"])
+
+        with patch("os.posix_spawn", return_value=4321) as spawn, patch("os.fork") as fork:
+            result = runner.invoke(cli, base + ["daemon", "start", "--background"])
+
+        assert result.exit_code == 0
+        assert "PID 4321" in result.output
+        fork.assert_not_called()
+        path, argv, env = spawn.call_args.args
+        assert argv[1:] == ["-m", "scripts.corp", "--project-dir", str(tmp_project),
+                            "daemon", "start"]
+        assert spawn.call_args.kwargs == {"setsid": True}
+        assert not (tmp_project / "data" / "daemon.pid").exists()
+
+
+class TestCLISchedule:
+    def test_schedule_add_list_remove(self, runner, tmp_project, create_worker):
+        """Round trip through the cached Scheduler."""
+        create_worker("alice")
+        base = ["--project-dir", str(tmp_project), "schedule"]
+        result = runner.invoke(cli, base + ["add", "alice", "report", "--interval", "60"])
+        assert result.exit_code == 0
+        task_id = result.output.split()[2].rstrip(":")
+
+        result = runner.invoke(cli, base + ["list"])
+        assert task_id in result.output
+
+        result = runner.invoke(cli, base + ["remove", task_id])
+        assert result.exit_code == 0
+        result = runner.invoke(cli, base + ["list"])
+        assert "No scheduled tasks" in result.output
+
+    def test_scheduler_reused_per_project(self, tmp_project):
+        """Same project dir returns the same Scheduler instance."""
+        from scripts.corp import _build_scheduler, _get_scheduler
+        _build_scheduler.cache_clear()
+        assert _get_scheduler(tmp_project) is _get_scheduler(tmp_project)
+
+    def test_scheduler_rebuilt_after_charter_edit(self, tmp_project):
+        """Editing charter.yaml invalidates the cached Scheduler."""
+        from scripts.corp import _build_scheduler, _get_scheduler
+        _build_scheduler.cache_clear()
+        first = _get_scheduler(tmp_project)
+        charter = yaml.safe_load((tmp_project / "charter.yaml").read_text())
+        charter["project"]["name"] = "Renamed Project"
+        (tmp_project / "charter.yaml").write_text(yaml.dump(charter))
+        second = _get_scheduler(tmp_project)
+        assert second is not first
+        assert second.config.name == "Renamed Project"
+
+
+class TestCLIWorkflowReadOnly:
+    def _store_runs(self, tmp_project):
+        from framework.db import get_db
+        db, lock = get_db(tmp_project / "data" / "workflows.json")
+        with lock:
+            db.insert({"id": "r1", "workflow_name": "daily", "status": "completed",
+                       "node_results": {"fetch": {"status": "completed"}},
+                       "started_at": "2026-01-01T00:00:00Z", "completed_at": "2026-01-01T00:01:00Z"})
+            db.insert({"id": "r2", "workflow_name": "weekly", "status": "failed",
+                       "node_results": {}, "started_at": "2026-01-02T00:00:00Z",
+                       "completed_at": "2026-01-02T00:01:00Z"})
+
+    def test_list_and_status_skip_engine(self, runner, tmp_project):
+        """Listing runs reads the store without building a Router or WorkflowEngine."""
+        self._store_runs(tmp_project)
+        base = ["--project-dir", str(tmp_project), "workflow"]
+        with patch("framework.router.Router.__init__", side_effect=AssertionError("router built")):
+            listed = runner.invoke(cli, base + ["list", "--name", "daily"])
+            status = runner.invoke(cli, base + ["status", "r1"])
+        assert listed.exit_code == 0
+        assert "r1 — daily — completed" in listed.output
+        assert "weekly" not in listed.output
+        assert status.exit_code == 0
+        assert "fetch: completed" in status.output
+
+    def test_status_unknown_run(self, runner, tmp_project):
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "workflow", "status", "nope"])
+        assert result.exit_code == 1
+        assert "not found" in result.output
+
 
 class TestCLIWebhook:
     def test_webhook_keygen(self, runner):
@@ -525,7 +921,7 @@ class TestCLIReviewDelegate:
 class TestCLIOps:
     def test_ops_list_empty(self, runner, tmp_path):
         """No operations registered."""
-        with patch("scripts.corp.OperationRegistry") as MockReg:
+        with patch("framework.registry.OperationRegistry") as MockReg:
             mock_reg = MockReg.return_value
             mock_reg.list_operations.return_value = {}
             mock_reg.get_active.return_value = None
@@ -536,12 +932,12 @@ class TestCLIOps:
     def test_ops_create_and_list(self, runner, tmp_path):
         """Create shows in list."""
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "create", "myproj", "--dir", str(tmp_path)])
         assert result.exit_code == 0
         assert "Registered" in result.output
 
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "list"])
         assert result.exit_code == 0
         assert "myproj" in result.output
@@ -550,7 +946,7 @@ class TestCLIOps:
         """Sets active operation."""
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
         reg.register("proj1", tmp_path / "proj1")
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "switch", "proj1"])
         assert result.exit_code == 0
         assert "Switched" in result.output
@@ -560,7 +956,7 @@ class TestCLIOps:
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
         reg.register("proj1", tmp_path / "proj1")
         reg.set_active("proj1")
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "active"])
         assert result.exit_code == 0
         assert "proj1" in result.output
@@ -569,7 +965,7 @@ class TestCLIOps:
         """Unregisters operation."""
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
         reg.register("proj1", tmp_path / "proj1")
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "remove", "proj1"])
         assert result.exit_code == 0
         assert "Removed" in result.output
@@ -577,7 +973,7 @@ class TestCLIOps:
     def test_ops_switch_unknown(self, runner, tmp_path):
         """Error for unknown name."""
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "switch", "ghost"])
         assert result.exit_code == 1
         assert "Error" in result.output
@@ -585,7 +981,7 @@ class TestCLIOps:
     def test_ops_remove_unknown(self, runner, tmp_path):
         """Error for unknown name."""
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(cli, ["ops", "remove", "ghost"])
         assert result.exit_code == 1
         assert "Error" in result.output
@@ -594,7 +990,7 @@ class TestCLIOps:
         """corp init adds to registry."""
         reg = OperationRegistry(registry_dir=tmp_path / ".reg")
         user_input = "My Project\nAlice\nBuild stuff\n3.00\n\n"
-        with patch("scripts.corp.OperationRegistry", return_value=reg):
+        with patch("framework.registry.OperationRegistry", return_value=reg):
             result = runner.invoke(
                 cli, ["--project-dir", str(tmp_path), "init"], input=user_input,
             )
@@ -636,7 +1032,7 @@ class TestCLIFire:
         config = ProjectConfig.load(tmp_project)
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log)
         scheduler.add_task(ScheduledTask(
             worker_name="tasked", message="test",
@@ -714,7 +1110,7 @@ class TestCLIValidate:
         config = ProjectConfig.load(tmp_project)
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log)
 
         # Create a worker dir so we can add a task, then delete the worker
@@ -737,6 +1133,73 @@ class TestCLIValidate:
         assert result.exit_code == 1
         assert "ghost" in result.output
 
+    def test_validate_checks_workflows(self, runner, tmp_project):
+        """Broken workflow files are reported in filename order."""
+        wf_dir = tmp_project / "workflows"
+        wf_dir.mkdir()
+        (wf_dir / "a_ok.yaml").write_text(yaml.dump({
+            "name": "ok", "nodes": {"n1": {"worker": "alice", "message": "hi"}},
+        }))
+        (wf_dir / "b_empty.yaml").write_text(yaml.dump({"name": "empty"}))
+        (wf_dir / "c_bad.yaml").write_text("nodes: [unclosed")
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "validate"])
+        assert result.exit_code == 1
+        lines = [line for line in result.output.splitlines() if "Workflow '" in line]
+        assert len(lines) == 2
+        assert "b_empty.yaml" in lines[0] and "no nodes" in lines[0]
+        assert "c_bad.yaml" in lines[1] and "Invalid YAML" in lines[1]
+
+    def test_validate_skips_non_workflow_entries(self, runner, tmp_project):
+        """Only regular *.yaml files are checked."""
+        wf_dir = tmp_project / "workflows"
+        wf_dir.mkdir()
+        (wf_dir / "notes.txt").write_text("nodes: [unclosed")
+        (wf_dir / "drafts.yaml").mkdir()
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "validate"])
+        assert result.exit_code == 0
+        assert "No issues found" in result.output
+
+
+class TestCLIEvents:
+    def test_events_empty(self, runner, tmp_project):
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "events"])
+        assert result.exit_code == 0
+        assert "No events." in result.output
+
+    def test_events_lists_with_data(self, runner, tmp_project, event_log):
+        """Each event line is followed by its data keys."""
+        from framework.events import Event
+        event_log.emit(Event(type="task.completed", source="scheduler:abc",
+                             data={"worker": "alice", "response": "x" * 300}))
+        event_log.emit(Event(type="task.started", source="scheduler:def"))
+        result = runner.invoke(cli, ["--project-dir", str(tmp_project), "events"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        idx = next(i for i, line in enumerate(lines) if "task.completed" in line)
+        assert lines[idx + 1] == "    worker: alice"
+        assert lines[idx + 2] == "    response: " + "x" * 100
+        assert "task.started — scheduler:def" in result.output
+
+
+class TestTrunc:
+    @pytest.mark.parametrize("value", [
+        "x" * 300,
+        42,
+        None,
+        {"a": 1},
+        [1, "two", {"three": [3.0]}],
+        {"nested": {"k": ["v" * 50] * 10}, "b": "it's"},
+        list(range(1000)),
+        {"k": "a" * 120 + "'"},
+        {"k": "a" * 120 + "'" + '"'},
+        ["\\" * 60 + '"', "b"],
+    ])
+    def test_matches_str_slice(self, value):
+        assert _trunc(value) == str(value)[:100]
+
+    def test_short_value_untouched(self):
+        assert _trunc({"a": [1, 2]}) == "{'a': [1, 2]}"
+
 
 class TestCLIBroker:
     def test_broker_account(self, runner, tmp_project):
@@ -760,3 +1223,22 @@ class TestCLIBroker:
         )
         assert result.exit_code == 0
         assert "Sold" in result.output
+
+    def test_broker_positions_and_trades(self, runner, tmp_project):
+        """One line per position / trade, newest trade first."""
+        base = ["--project-dir", str(tmp_project), "broker"]
+        runner.invoke(cli, base + ["buy", "AAPL", "2", "--price", "100"])
+        runner.invoke(cli, base + ["buy", "MSFT", "1", "--price", "300"])
+
+        result = runner.invoke(cli, base + ["positions"])
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "  AAPL: 2.0 shares @ $100.00",
+            "  MSFT: 1.0 shares @ $300.00",
+        ]
+
+        result = runner.invoke(cli, base + ["trades"])
+        lines = result.output.splitlines()
+        assert len(lines) == 2
+        assert "BUY 1.0 MSFT" in lines[0]
+        assert "BUY 2.0 AAPL" in lines[1]
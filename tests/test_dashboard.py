@@ -79,7 +79,7 @@ class TestDashboardEvents:
         assert resp.status_code == 200
 
     def test_events_with_type_filter(self, dashboard_client, tmp_project):
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         event_log.emit(Event(type="test.ping", source="test"))
         resp = dashboard_client.get("/events?type=test.ping")
         assert resp.status_code == 200
@@ -130,7 +130,7 @@ class TestDashboardAPI:
         assert isinstance(data, list)
 
     def test_api_events_with_filter(self, dashboard_client, tmp_project):
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         event_log.emit(Event(type="api.test", source="test"))
         event_log.emit(Event(type="other.event", source="test"))
         resp = dashboard_client.get("/api/events?type=api.test")
@@ -1,10 +1,11 @@
 """Tests for framework/db.py — thread-safe TinyDB wrapper."""
 
+import sqlite3
 import threading
 
 import pytest
 
-from framework.db import _reset_registry, close_all, get_db
+from framework.db import _reset_registry, close_all, get_db, get_sqlite
 
 
 @pytest.fixture(autouse=True)
@@ -43,6 +44,25 @@ class TestGetDb:
         assert db_path.parent.exists()
 
 
+class TestGetSqlite:
+    def test_same_path_same_connection(self, tmp_path):
+        """Same path returns the same connection and lock, in WAL mode."""
+        conn1, lock1 = get_sqlite(tmp_path / "test.db")
+        conn2, lock2 = get_sqlite(tmp_path / "test.db")
+        assert conn1 is conn2
+        assert lock1 is lock2
+        assert conn1.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_close_all_closes_sqlite(self, tmp_path):
+        """close_all drops SQLite connections too."""
+        conn1, _ = get_sqlite(tmp_path / "test.db")
+        close_all()
+        conn2, _ = get_sqlite(tmp_path / "test.db")
+        assert conn1 is not conn2
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn1.execute("SELECT 1")
+
+
 class TestCloseAll:
     def test_close_all(self, tmp_path):
         """All instances closed, registry empty."""
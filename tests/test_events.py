@@ -1,5 +1,6 @@
 """Tests for framework/events.py — event log and pub/sub."""
 
+import json
 import threading
 
 import pytest
@@ -9,7 +10,7 @@ from framework.events import Event, EventLog
 
 @pytest.fixture
 def event_log(tmp_path):
-    return EventLog(tmp_path / "data" / "events.json")
+    return EventLog(tmp_path / "data" / "events.db")
 
 
 class TestEventLog:
@@ -30,7 +31,7 @@ class TestEventLog:
         assert results[0]["timestamp"] == "2026-01-01T00:00:00Z"
 
     def test_emit_persists(self, event_log):
-        """Emitted event is found in TinyDB."""
+        """Emitted event is found in the database."""
         event = Event(type="task.done", source="worker:alice", data={"result": "ok"})
         event_log.emit(event)
         results = event_log.query()
@@ -118,6 +119,65 @@ class TestEventLog:
         assert results[1]["data"]["i"] == 8
         assert results[2]["data"]["i"] == 7
 
+    def test_iter_query_spans_batches(self, event_log):
+        """iter_query yields every row even when the limit exceeds one fetch batch."""
+        for i in range(250):
+            event_log.emit(Event(type="seq", source="test", data={"i": i},
+                                 timestamp=f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}Z"))
+        results = event_log.iter_query(limit=240)
+        assert not isinstance(results, list)
+        assert [r["data"]["i"] for r in results] == list(range(249, 9, -1))
+
+    def test_remove_before(self, event_log):
+        """Only events older than the cutoff are deleted."""
+        event_log.emit(Event(type="old", source="test", timestamp="2026-01-01T00:00:00Z"))
+        event_log.emit(Event(type="new", source="test", timestamp="2026-02-01T00:00:00Z"))
+        assert event_log.remove_before("2026-01-15T00:00:00Z") == 1
+        assert [r["type"] for r in event_log.query()] == ["new"]
+
+    def test_query_uses_type_index(self, event_log):
+        """Type-filtered queries are served by the (type, ts) index."""
+        db, _ = event_log._connect()
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT ts FROM events WHERE type = ? ORDER BY ts DESC LIMIT 5",
+            ("a",),
+        ).fetchall()
+        assert "idx_events_type_ts" in str(plan)
+
+    def test_opens_database_lazily(self, tmp_path):
+        """Constructing an EventLog doesn't touch disk until it's used."""
+        event_log = EventLog(tmp_path / "data" / "events.db")
+        assert not (tmp_path / "data").exists()
+        event_log.emit(Event(type="a", source="test"))
+        assert (tmp_path / "data" / "events.db").exists()
+
+
+class TestEventLogMigration:
+    def test_migrates_legacy_json(self, tmp_path):
+        """A TinyDB events.json is imported once and moved aside."""
+        legacy = tmp_path / "events.json"
+        legacy.write_text(json.dumps({"_default": {
+            "1": {"type": "a", "source": "s", "data": {"i": 1}, "timestamp": "2026-01-01T00:00:00Z"},
+            "2": {"type": "b", "source": "s", "data": {}, "timestamp": "2026-01-02T00:00:00Z"},
+        }}))
+
+        event_log = EventLog(tmp_path / "events.db")
+        results = event_log.query()
+        assert [r["type"] for r in results] == ["b", "a"]
+        assert results[1]["data"] == {"i": 1}
+        assert not legacy.exists()
+        assert (tmp_path / "events.json.migrated").exists()
+
+        # Re-opening doesn't import again
+        assert len(EventLog(tmp_path / "events.db").query()) == 2
+
+    def test_unreadable_legacy_json_left_in_place(self, tmp_path):
+        legacy = tmp_path / "events.json"
+        legacy.write_text("{not json")
+        event_log = EventLog(tmp_path / "events.db")
+        assert event_log.query() == []
+        assert legacy.exists()
+
 
 class TestEventLogThreadSafety:
     def test_concurrent_emits(self, event_log):
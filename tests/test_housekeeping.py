@@ -10,6 +10,7 @@ from click.testing import CliRunner
 
 from framework.config import RetentionConfig
 from framework.db import get_db
+from framework.events import Event, EventLog
 from framework.housekeeping import Housekeeper
 from scripts.corp import cli
 
@@ -26,26 +27,23 @@ class TestCleanEvents:
     def test_clean_events_removes_old(self, tmp_project):
         """Events older than cutoff removed."""
         retention = RetentionConfig(events_days=30)
-        db, lock = get_db(tmp_project / "data" / "events.json")
-        with lock:
-            db.insert({"type": "old", "timestamp": _iso_days_ago(60)})
-            db.insert({"type": "recent", "timestamp": _iso_days_ago(10)})
+        event_log = EventLog(tmp_project / "data" / "events.db")
+        event_log.emit(Event(type="old", source="test", timestamp=_iso_days_ago(60)))
+        event_log.emit(Event(type="recent", source="test", timestamp=_iso_days_ago(10)))
 
         hk = Housekeeper(tmp_project, retention)
         removed = hk.clean_events()
         assert removed == 1
-        with lock:
-            remaining = db.all()
+        remaining = event_log.query()
         assert len(remaining) == 1
         assert remaining[0]["type"] == "recent"
 
     def test_clean_events_keeps_recent(self, tmp_project):
         """Events within window kept."""
         retention = RetentionConfig(events_days=30)
-        db, lock = get_db(tmp_project / "data" / "events.json")
-        with lock:
-            db.insert({"type": "a", "timestamp": _iso_days_ago(5)})
-            db.insert({"type": "b", "timestamp": _iso_days_ago(10)})
+        event_log = EventLog(tmp_project / "data" / "events.db")
+        event_log.emit(Event(type="a", source="test", timestamp=_iso_days_ago(5)))
+        event_log.emit(Event(type="b", source="test", timestamp=_iso_days_ago(10)))
 
         hk = Housekeeper(tmp_project, retention)
         removed = hk.clean_events()
@@ -53,8 +51,8 @@ class TestCleanEvents:
 
     def test_clean_events_empty(self, tmp_project):
         """No crash on missing DB file."""
-        # Don't create events.json
-        (tmp_project / "data" / "events.json").unlink(missing_ok=True)
+        # Don't create events.db
+        (tmp_project / "data" / "events.db").unlink(missing_ok=True)
         hk = Housekeeper(tmp_project, RetentionConfig())
         removed = hk.clean_events()
         assert removed == 0
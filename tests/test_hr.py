@@ -11,6 +11,7 @@ import yaml
 from framework.exceptions import TrainingError, WorkerNotFound
 from framework.knowledge import KnowledgeBase
 from framework.hr import HR
+from framework.validation import safe_load_yaml
 
 
 def _create_template(templates_dir, name="researcher"):
@@ -96,6 +97,28 @@ class TestHR:
         with pytest.raises(WorkerNotFound, match="ghost"):
             hr.fire("ghost", confirm=True)
 
+    def test_list_workers_reparses_only_changed_files(self, tmp_project, config):
+        """Unchanged YAML is served from cache; a promotion is picked up."""
+        hr = HR(config, tmp_project)
+        hr.hire_from_scratch("cached", role="analyst")
+        assert hr.list_workers()[0]["level"] == 1
+
+        with patch("framework.hr.safe_load_yaml", wraps=safe_load_yaml) as parse:
+            hr.list_workers()
+            assert parse.call_count == 0
+            hr.promote("cached")
+            assert hr.list_workers()[0]["level"] == 2
+
+    def test_list_workers_prunes_fired_from_cache(self, tmp_project, config):
+        """Cache entries for a fired worker go on the next listing."""
+        hr = HR(config, tmp_project)
+        hr.hire_from_scratch("stays", role="analyst")
+        hr.hire_from_scratch("goes", role="temp")
+        hr.list_workers()
+        hr.fire("goes", confirm=True)
+        hr.list_workers()
+        assert {p.parent.name for p in hr._yaml_cache} == {"stays"}
+
     def test_promote(self, tmp_project, config):
         """Promote increments level, capped at 5."""
         hr = HR(config, tmp_project)
@@ -154,6 +177,17 @@ class TestDemoteAndReview:
         assert review[0]["name"] == "star"
         assert review[0]["avg_rating"] == 5.0
 
+    def test_team_review_limit(self, tmp_project, config):
+        """limit keeps only the top-rated workers, in order."""
+        hr = HR(config, tmp_project)
+        from framework.worker import Worker
+        for name, rating in [("low", 2), ("high", 5), ("mid", 4)]:
+            hr.hire_from_scratch(name, role="analyst")
+            Worker(name, tmp_project, config).record_performance("t", "completed", rating=rating)
+
+        review = hr.team_review(limit=2)
+        assert [r["name"] for r in review] == ["high", "mid"]
+
     def test_team_review_empty(self, tmp_project, config):
         """Empty list when no workers."""
         hr = HR(config, tmp_project)
@@ -223,7 +257,7 @@ class TestFireWithCleanup:
 
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log)
 
         scheduler.add_task(ScheduledTask(
@@ -255,7 +289,7 @@ class TestFireWithCleanup:
 
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log)
 
         scheduler.add_task(ScheduledTask(
@@ -66,7 +66,7 @@ class TestConcurrentAccess:
 
     def test_concurrent_event_emission(self, tmp_project, config):
         """Multiple threads emitting events don't lose data."""
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         errors = []
 
         def emit(i):
@@ -137,7 +137,7 @@ class TestErrorRecovery:
         _create_worker_files(tmp_project / "workers" / "alice")
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         engine = WorkflowEngine(config, accountant, router, event_log,
                                 db_path=tmp_project / "data" / "workflows.json")
 
@@ -160,7 +160,7 @@ class TestErrorRecovery:
         _create_worker_files(tmp_project / "workers" / "alice")
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         engine = WorkflowEngine(config, accountant, router, event_log,
                                 db_path=tmp_project / "data" / "workflows.json")
 
@@ -179,7 +179,7 @@ class TestErrorRecovery:
         _create_worker_files(tmp_project / "workers" / "temp")
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log,
                               db_path=tmp_project / "data" / "scheduler.json")
 
@@ -205,7 +205,7 @@ class TestSecurityIntegration:
 
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log,
                               db_path=tmp_project / "data" / "scheduler.json")
 
@@ -270,7 +270,7 @@ class TestSecurityIntegration:
 
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
 
         with patch.dict(os.environ, {"WEBHOOK_API_KEY": "test-secret"}):
             app = create_webhook_app(config, accountant, router, event_log)
@@ -289,7 +289,7 @@ class TestSecurityIntegration:
         """Scheduler rejects invalid worker names."""
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log,
                               db_path=tmp_project / "data" / "scheduler.json")
 
@@ -1,6 +1,7 @@
 """Tests for framework/knowledge.py."""
 
 import json
+from dataclasses import asdict
 
 import pytest
 
@@ -109,6 +110,13 @@ class TestSearchKnowledge:
         result = search_knowledge(entries, "python", max_chars=10000)
         assert result[0].content == "python python python"
 
+    def test_case_insensitive_and_cached(self):
+        """Matching ignores case; the lowercased text is kept on the entry, not saved."""
+        entries = self._make_entries(["PYTHON Python python", "nothing"])
+        assert search_knowledge(entries, "python", max_chars=10000) == entries[:1]
+        assert entries[0].__dict__["content_lower"] == "python python python"
+        assert "content_lower" not in asdict(entries[0])
+
     def test_empty_entries(self):
         """Empty entries list returns empty."""
         assert search_knowledge([], "query", max_chars=1000) == []
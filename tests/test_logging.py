@@ -100,7 +100,7 @@ class TestIntegrationLogging:
 
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         engine = WorkflowEngine(config, accountant, router, event_log,
                                 db_path=tmp_project / "data" / "workflows.json")
 
@@ -44,6 +44,50 @@ class TestRouter:
         assert result["cost"] > 0
         assert accountant.today_spent() > 0
 
+    def test_chat_reuses_client(self, config, accountant):
+        """Consecutive calls share one pooled client; close() drops it."""
+        router = Router(config, accountant, api_key="test-key")
+        messages = [{"role": "user", "content": "Hello"}]
+
+        with respx.mock:
+            respx.post(OPENROUTER_API_URL).mock(
+                return_value=httpx.Response(200, json=_mock_openrouter_response())
+            )
+            router.chat(messages, tier="cheap")
+            client = router.client
+            router.chat(messages, tier="cheap")
+
+        assert router.client is client
+        router.close()
+        assert client.is_closed
+        assert router._client is None
+
+    def test_client_created_once_across_threads(self, config, accountant):
+        """Threads racing on the first .client access all share one client."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        router = Router(config, accountant, api_key="test-key")
+        made = []
+        real_client = httpx.Client
+        barrier = threading.Barrier(8)
+
+        def slow_client(**kwargs):
+            time.sleep(0.01)  # widen the window between the None check and assignment
+            made.append(real_client(**kwargs))
+            return made[-1]
+
+        def grab(_):
+            barrier.wait()
+            return router.client
+
+        with patch("framework.router.httpx.Client", side_effect=slow_client):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                clients = list(pool.map(grab, range(8)))
+        assert len(made) == 1
+        assert all(c is made[0] for c in clients)
+        router.close()
+
     def test_model_fallback_on_error(self, config, accountant):
         """When first model returns 503 through all retries, falls back to next model."""
         # max_retries=0 to skip retries and test pure fallback
@@ -67,7 +111,7 @@ class TestRouter:
 
     def test_all_models_fail_raises(self, config, accountant):
         """When all models fail, raises ModelUnavailable."""
-        router = Router(config, accountant, api_key="test-key")
+        router = Router(config, accountant, api_key="test-key", retry_base_delay=0.01)
         messages = [{"role": "user", "content": "Hello"}]
 
         with respx.mock:
@@ -31,7 +31,7 @@ def scheduler_env(tmp_project, config):
     """Set up scheduler with all dependencies."""
     accountant = Accountant(config)
     router = Router(config, accountant, api_key="test-key")
-    event_log = EventLog(tmp_project / "data" / "events.json")
+    event_log = EventLog(tmp_project / "data" / "events.db")
     scheduler = Scheduler(config, accountant, router, event_log,
                           db_path=tmp_project / "data" / "scheduler.json")
     _create_worker_files(tmp_project / "workers" / "alice")
@@ -117,3 +117,17 @@ class TestTaskRouter:
         best1 = router.select_worker("general task")
         best2 = router.select_worker("general task")
         assert best1 == best2  # Same result both times
+
+    def test_custom_worker_loader(self, tmp_project, config):
+        """Workers come from the supplied loader when one is given."""
+        _create_worker(tmp_project / "workers", "a", "analyst", ["analysis"])
+        _create_worker(tmp_project / "workers", "b", "writer", ["writing"])
+        loaded = []
+
+        def load(name):
+            loaded.append(name)
+            return Worker(name, tmp_project, config)
+
+        router = TaskRouter(config, HR(config, tmp_project), load_worker=load)
+        assert router.select_worker("writing task") == "b"
+        assert sorted(loaded) == ["a", "b"]
@@ -13,6 +13,8 @@ from framework.events import EventLog
 from framework.hr import HR
 from framework.router import Router
 from framework.scheduler import Scheduler, ScheduledTask
+from framework.task_router import TaskRouter
+from framework.workflow import WorkflowEngine
 
 
 @pytest.fixture
@@ -26,7 +28,12 @@ def bot_setup(tmp_project, config, accountant):
     bot_module._router = router
     bot_module._hr = hr
     bot_module._project_dir = tmp_project
+    bot_module._event_log = EventLog(tmp_project / "data" / "events.db")
+    bot_module._scheduler = Scheduler(config, accountant, router, bot_module._event_log)
+    bot_module._workflow_engine = WorkflowEngine(config, accountant, router, bot_module._event_log)
+    bot_module._task_router = TaskRouter(config, hr, load_worker=bot_module._get_worker)
     bot_module._user_workers.clear()
+    bot_module._worker_cache.clear()
 
     yield
 
@@ -36,7 +43,12 @@ def bot_setup(tmp_project, config, accountant):
     bot_module._router = None
     bot_module._hr = None
     bot_module._project_dir = None
+    bot_module._event_log = None
+    bot_module._scheduler = None
+    bot_module._workflow_engine = None
+    bot_module._task_router = None
     bot_module._user_workers.clear()
+    bot_module._worker_cache.clear()
 
 
 def _make_update(user_id=1, text="", args=None):
@@ -113,6 +125,30 @@ class TestCmdChat:
         reply = update.message.reply_text.call_args[0][0]
         assert "carol" in reply
 
+    @pytest.mark.asyncio
+    async def test_chat_selection_survives_restart(self, bot_setup, create_worker, tmp_project):
+        """Selection is written to data/bot_sessions.json and reloaded."""
+        create_worker("carol")
+        update, context = _make_update(user_id=42, args=["carol"])
+
+        await bot_module.cmd_chat(update, context)
+
+        saved = json.loads((tmp_project / "data" / "bot_sessions.json").read_text())
+        assert saved == {"42": "carol"}
+        bot_module._user_workers.clear()
+        assert bot_module._load_sessions() == {42: "carol"}
+
+    @pytest.mark.asyncio
+    async def test_missing_worker_dropped_from_sessions(self, bot_setup, tmp_project):
+        """A stale selection is removed from memory and from disk."""
+        bot_module._user_workers[7] = "ghost"
+        update, context = _make_update(user_id=7, text="hi")
+
+        await bot_module.handle_message(update, context)
+
+        assert 7 not in bot_module._user_workers
+        assert bot_module._load_sessions() == {}
+
     @pytest.mark.asyncio
     async def test_chat_no_args(self, bot_setup):
         """Reply contains 'Usage:'."""
@@ -189,6 +225,60 @@ class TestHandleMessage:
         assert "4" in reply
 
 
+class TestWorkerCache:
+    def test_reused_until_files_change(self, bot_setup, create_worker):
+        """Same Worker object while its files are untouched; reloaded after an edit."""
+        wdir = create_worker("erin")
+        first = bot_module._get_worker("erin")
+        assert bot_module._get_worker("erin") is first
+
+        (wdir / "memory.json").write_text(json.dumps([{"type": "note", "content": "x"}]))
+        reloaded = bot_module._get_worker("erin")
+        assert reloaded is not first
+        assert len(reloaded.memory) == 1
+
+    def test_own_writes_keep_cache(self, bot_setup, create_worker):
+        """A worker's own memory writes don't force a reload once re-stamped."""
+        create_worker("finn")
+        worker = bot_module._get_worker("finn")
+        worker.update_memory("interaction", "hello")
+        bot_module._refresh_worker_stamp("finn")
+        assert bot_module._get_worker("finn") is worker
+
+    def test_outside_edit_during_chat_still_reloads(self, bot_setup, create_worker):
+        """Re-stamping after chat() doesn't hide a profile edit made meanwhile."""
+        wdir = create_worker("hana")
+        worker = bot_module._get_worker("hana")
+        worker.update_memory("interaction", "hello")
+        (wdir / "profile.md").write_text("# Hana\n\nEdited while chatting, much longer.\n")
+        bot_module._refresh_worker_stamp("hana")
+        assert bot_module._get_worker("hana") is not worker
+
+    def test_concurrent_misses_build_once(self, bot_setup, create_worker):
+        """Threads racing on a cold cache all get the same Worker object."""
+        from concurrent.futures import ThreadPoolExecutor
+        create_worker("gail")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            workers = list(pool.map(lambda _: bot_module._get_worker("gail"), range(16)))
+        assert all(w is workers[0] for w in workers)
+
+    def test_missing_worker_raises(self, bot_setup):
+        from framework.exceptions import WorkerNotFound
+        with pytest.raises(WorkerNotFound):
+            bot_module._get_worker("ghost")
+
+    def test_fired_worker_evicted(self, bot_setup, create_worker):
+        """Once a cached worker's directory is gone, its entry is dropped."""
+        import shutil
+        from framework.exceptions import WorkerNotFound
+        wdir = create_worker("hank")
+        bot_module._get_worker("hank")
+        shutil.rmtree(wdir)
+        with pytest.raises(WorkerNotFound):
+            bot_module._get_worker("hank")
+        assert wdir not in bot_module._worker_cache
+
+
 def _make_callback_query(data=""):
     """Create a mock Update with callback_query for inline keyboard tests."""
     update = MagicMock()
@@ -248,6 +338,21 @@ class TestCmdFire:
         reply = update.callback_query.edit_message_text.call_args[0][0]
         assert "Cancelled" in reply
 
+    @pytest.mark.asyncio
+    async def test_fire_callback_name_with_underscores(self, bot_setup, create_worker):
+        """Everything after the prefix is the worker name."""
+        create_worker("data_bot")
+        update, context = _make_callback_query(data="fire_yes_data_bot")
+        await bot_module.handle_fire_callback(update, context)
+        reply = update.callback_query.edit_message_text.call_args[0][0]
+        assert reply.startswith("Fired 'data_bot'")
+
+    @pytest.mark.asyncio
+    async def test_fire_callback_unknown_action_ignored(self, bot_setup):
+        update, context = _make_callback_query(data="fire_maybe")
+        await bot_module.handle_fire_callback(update, context)
+        update.callback_query.edit_message_text.assert_not_called()
+
 
 class TestCmdReview:
     @pytest.mark.asyncio
@@ -293,13 +398,13 @@ class TestCmdDelegate:
         create_worker("alice", role="tester")
         update, context = _make_update(args=["run", "tests"])
 
-        with patch("scripts.telegram_bot.Worker") as MockWorker:
-            mock_instance = MockWorker.return_value
-            mock_instance.chat.return_value = ("tests passed", [])
+        with patch("framework.worker.Worker.chat", return_value=("tests passed", [])):
             await bot_module.cmd_delegate(update, context)
 
         reply = update.message.reply_text.call_args[0][0]
         assert "tests passed" in reply
+        # Scoring loaded alice through the bot's cache; the reply reused that object
+        assert len(bot_module._worker_cache) == 1
 
 
 class TestCmdEvents:
@@ -315,7 +420,7 @@ class TestCmdEvents:
     async def test_events_shows_recent(self, bot_setup):
         """Shows events after emitting one."""
         from framework.events import Event
-        event_log = EventLog(bot_module._project_dir / "data" / "events.json")
+        event_log = EventLog(bot_module._project_dir / "data" / "events.db")
         event_log.emit(Event(type="test.event", source="test"))
 
         update, context = _make_update()
@@ -353,3 +458,46 @@ class TestCmdInspect:
         reply = update.message.reply_text.call_args[0][0]
         assert "Test Project" in reply
         assert "Budget:" in reply
+
+
+class TestMain:
+    def _run_main(self, tmp_project, monkeypatch, env):
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "123:abc")
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        with patch("scripts.telegram_bot.Application") as MockApp:
+            bot_module.main(tmp_project)
+        return MockApp.builder.return_value.token.return_value.build.return_value
+
+    def test_installs_uvloop_when_available(self, bot_setup, tmp_project, monkeypatch):
+        fake_uvloop = MagicMock()
+        monkeypatch.setattr(bot_module, "uvloop", fake_uvloop)
+        monkeypatch.delenv("TELEGRAM_WEBHOOK_URL", raising=False)
+        with patch("scripts.telegram_bot.asyncio.set_event_loop") as set_loop:
+            self._run_main(tmp_project, monkeypatch, {})
+        set_loop.assert_called_once_with(fake_uvloop.new_event_loop.return_value)
+
+    def test_polls_by_default(self, bot_setup, tmp_project, monkeypatch):
+        monkeypatch.delenv("TELEGRAM_WEBHOOK_URL", raising=False)
+        app = self._run_main(tmp_project, monkeypatch, {})
+        app.run_polling.assert_called_once()
+        app.run_webhook.assert_not_called()
+
+    def test_webhook_when_url_set(self, bot_setup, tmp_project, monkeypatch):
+        monkeypatch.delenv("TELEGRAM_WEBHOOK_SECRET", raising=False)
+        app = self._run_main(tmp_project, monkeypatch, {
+            "TELEGRAM_WEBHOOK_URL": "https://bot.example.com/", "PORT": "8080",
+        })
+        app.run_polling.assert_not_called()
+        kwargs = app.run_webhook.call_args.kwargs
+        assert kwargs["port"] == 8080
+        assert kwargs["url_path"] == "123:abc"
+        assert kwargs["webhook_url"] == "https://bot.example.com/123:abc"
+        assert kwargs["secret_token"] is None
+
+    def test_webhook_passes_secret_token(self, bot_setup, tmp_project, monkeypatch):
+        app = self._run_main(tmp_project, monkeypatch, {
+            "TELEGRAM_WEBHOOK_URL": "https://bot.example.com",
+            "TELEGRAM_WEBHOOK_SECRET": "s3cret_token",
+        })
+        assert app.run_webhook.call_args.kwargs["secret_token"] == "s3cret_token"
@@ -5,11 +5,16 @@ import time
 from pathlib import Path
 
 import pytest
+import yaml
 
 from framework.exceptions import ValidationError
 from framework.validation import (
     RateLimiter,
+    dump_json,
+    parse_json,
+    safe_dump_yaml,
     safe_load_json,
+    safe_load_yaml,
     safe_write_json,
     validate_path_within,
     validate_payload_size,
@@ -176,6 +181,33 @@ class TestSafeLoadJson:
         assert result == {"fallback": True}
 
 
+class TestParseJson:
+    def test_bytes_and_str(self):
+        assert parse_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert parse_json('{"a": "\u00e9"}') == {"a": "\u00e9"}
+
+    def test_accepts_what_stdlib_accepts(self):
+        """NaN and big ints still parse even though orjson rejects them."""
+        result = parse_json(b'{"x": NaN, "n": 123456789012345678901234567890}')
+        assert result["x"] != result["x"]
+        assert result["n"] == 123456789012345678901234567890
+
+    def test_invalid_raises_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            parse_json(b"{broken")
+
+
+class TestDumpJson:
+    def test_roundtrip_and_indent(self):
+        data = {"a": [1, 2], "b": "\u00e9"}
+        assert json.loads(dump_json(data)) == data
+        assert "\n  " in dump_json(data, indent=True)
+
+    def test_falls_back_for_int_keys(self):
+        """Non-str keys orjson rejects are stringified like json.dumps does."""
+        assert json.loads(dump_json({1: "x"})) == {"1": "x"}
+
+
 class TestSafeWriteJson:
     def test_creates_file(self, tmp_path):
         p = tmp_path / "output.json"
@@ -194,3 +226,22 @@ class TestSafeWriteJson:
         safe_write_json(p, data)
         loaded = safe_load_json(p)
         assert loaded == data
+
+
+class TestSafeLoadYaml:
+    def test_parses_mapping(self):
+        assert safe_load_yaml("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+
+    def test_rejects_python_tags(self):
+        """Still a safe loader — arbitrary object tags are refused."""
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("!!python/object/apply:os.system ['true']")
+
+
+class TestSafeDumpYaml:
+    def test_block_style_roundtrip(self):
+        data = {"name": "alice", "skills": ["a", "b"], "level": 2}
+        text = safe_dump_yaml(data, sort_keys=False)
+        assert text.startswith("name: alice\n")
+        assert "- a" in text
+        assert safe_load_yaml(text) == data
@@ -38,7 +38,7 @@ def webhook_env(tmp_project, config):
     """Set up webhook app with all dependencies."""
     accountant = Accountant(config)
     router = Router(config, accountant, api_key="test-key")
-    event_log = EventLog(tmp_project / "data" / "events.json")
+    event_log = EventLog(tmp_project / "data" / "events.db")
     scheduler = Scheduler(config, accountant, router, event_log,
                           db_path=tmp_project / "data" / "scheduler.json")
     _create_worker_files(tmp_project / "workers" / "alice")
@@ -329,7 +329,7 @@ class TestWebhookRateLimit:
 
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
         scheduler = Scheduler(config, accountant, router, event_log,
                               db_path=tmp_project / "data" / "scheduler.json")
 
@@ -347,7 +347,7 @@ class TestWebhookRateLimit:
         """Webhook rejects payloads over 1MB."""
         accountant = Accountant(config)
         router = Router(config, accountant, api_key="test-key")
-        event_log = EventLog(tmp_project / "data" / "events.json")
+        event_log = EventLog(tmp_project / "data" / "events.db")
 
         with patch.dict(os.environ, {"WEBHOOK_API_KEY": "test-secret"}):
             app = create_webhook_app(config, accountant, router, event_log)
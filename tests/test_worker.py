@@ -1,18 +1,20 @@
 """Tests for framework/worker.py."""
 
 import json
+from unittest.mock import patch
 
 import httpx
 import pytest
 import respx
 import yaml
 
+import framework.plugins as plugins
 from framework.accountant import Accountant
 from framework.config import ProjectConfig
 from framework.exceptions import WorkerNotFound
 from framework.knowledge import KnowledgeBase, KnowledgeEntry
 from framework.router import OPENROUTER_API_URL, Router
-from framework.worker import LEVEL_TIER_MAP, Worker
+from framework.worker import LEVEL_TIER_MAP, Worker, level_title
 
 
 def _create_worker_files(worker_dir, level=1):
@@ -53,6 +55,12 @@ class TestWorker:
             worker = Worker(f"w{level}", tmp_project, config)
             assert worker.get_tier() == expected_tier, f"Level {level} → {expected_tier}"
 
+    def test_level_title(self):
+        """Known levels map to titles; anything else falls back to L<n>."""
+        assert level_title(1) == "Intern"
+        assert level_title(5) == "Principal"
+        assert level_title(7) == "L7"
+
     def test_build_system_prompt(self, tmp_project, config):
         """System prompt includes profile, skills, and honest AI reminder."""
         _create_worker_files(tmp_project / "workers" / "bob")
@@ -630,3 +638,22 @@ class TestWorkerTools:
         # Tools should be in the payload (L1 has safe tools)
         request_body = json.loads(route.calls[0].request.content)
         assert "tools" in request_body
+
+    def test_tool_registry_reused_across_turns(self, tmp_project, config):
+        """Plugins are loaded once per Worker, not on every chat turn."""
+        config.tools.enabled = True
+        _create_worker_files(tmp_project / "workers" / "t6", level=1)
+        worker = Worker("t6", tmp_project, config)
+        accountant = Accountant(config)
+        router = Router(config, accountant, api_key="test-key")
+
+        with respx.mock:
+            respx.post(OPENROUTER_API_URL).mock(
+                return_value=self._mock_router_response("one")
+            )
+            with patch.object(plugins, "create_default_registry",
+                              wraps=plugins.create_default_registry) as build:
+                _, history = worker.chat("hi", router)
+                worker.chat("again", router, history=history)
+
+        assert build.call_count == 1
@@ -43,7 +43,7 @@ def workflow_env(tmp_project, config):
     """Set up workflow engine with all dependencies."""
     accountant = Accountant(config)
     router = Router(config, accountant, api_key="test-key")
-    event_log = EventLog(tmp_project / "data" / "events.json")
+    event_log = EventLog(tmp_project / "data" / "events.db")
     engine = WorkflowEngine(config, accountant, router, event_log,
                             db_path=tmp_project / "data" / "workflows.json")
     _create_worker_files(tmp_project / "workers" / "researcher")
@@ -400,7 +400,7 @@ class TestWorkflowNodeTimeoutRetries:
         engine, event_log, tmp_project = workflow_env
 
         def slow_chat(*args, **kwargs):
-            time.sleep(5)
+            time.sleep(2)
             return ("result", [])
 
         wf = Workflow(name="timeout", description="test", nodes=[
@@ -495,7 +495,7 @@ class TestWorkflowNodeTimeoutRetries:
         engine, event_log, tmp_project = workflow_env
 
         def slow_chat(*args, **kwargs):
-            time.sleep(5)
+            time.sleep(2)
             return ("result", [])
 
         # Two nodes at same depth: a (slow, 1s timeout) and b (fast)
@@ -509,7 +509,7 @@ class TestWorkflowNodeTimeoutRetries:
             with patch("framework.worker.Worker.chat") as mock_chat:
                 def side_effect(msg, router, **kwargs):
                     if "slow" in msg:
-                        time.sleep(5)
+                        time.sleep(2)
                     return ("done", [])
                 mock_chat.side_effect = side_effect
                 run = engine.run(wf)